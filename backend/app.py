@@ -7,12 +7,15 @@ development-time CORS settings for local React frontends.
 It then starts the HTTP server using environment-based configuration.
 """
 
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 import os
 
+import orjson
 from dotenv import load_dotenv
-from flask import Flask
-from flask_cors import CORS
+from flask import Flask, g, request
+from flask.json.provider import DefaultJSONProvider
 
 from blueprints.admin.clients_admin import clients_admin_bp
 from blueprints.admin.flags_admin import flags_admin_bp
@@ -20,69 +23,190 @@ from blueprints.auth.auth import auth_bp
 from blueprints.docs.docs import docs_bp
 from blueprints.flags.evaluate import evaluate_bp
 from blueprints.system.health import health_bp
-from errors.handlers import register_error_handlers
+from errors.handlers import BadRequest, register_error_handlers
+
+
+# CORS configuration for local React development frontends.
+# The header values are pre-joined once at import time so the
+# per-request hook only does an O(1) origin check and a few
+# dict assignments (no list joins per request).
+_ALLOWED_ORIGINS = frozenset(
+    {
+        "http://localhost:3000",
+        "http://localhost:5173",
+    }
+)
+_ALLOW_METHODS = "GET,POST,DELETE,OPTIONS"
+_ALLOW_HEADERS = "Content-Type,X-Api-Key,X-Session-Token"
+# Let browsers cache the preflight response for 24h so the SPA pays the
+# OPTIONS round-trip once per day per origin instead of once per call.
+_PREFLIGHT_MAX_AGE = "86400"
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's C encoder.
+
+    Routes every ``jsonify`` call (views and error handlers alike)
+    through orjson instead of the stdlib encoder. UUID and datetime
+    values are serialized natively by orjson; anything else falls back
+    to the default handler inherited from Flask.
+    """
+
+    @staticmethod
+    def default(obj):
+        """Handle types orjson rejects (e.g. MappingProxyType views)."""
+        if isinstance(obj, MappingProxyType):
+            return dict(obj)
+        return DefaultJSONProvider.default(obj)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# HTTP methods that may carry a JSON body worth parsing up front.
+_JSON_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# All blueprints, in registration order. Frozen at import time so
+# create_app() (which may run once per gunicorn worker) just loops over
+# a tuple baked into the .pyc instead of six separate statements.
+_BLUEPRINTS = (
+    health_bp,         # /health/
+    flags_admin_bp,    # /admin/flags/
+    clients_admin_bp,  # /clients/signup, /clients/me
+    evaluate_bp,       # /evaluate/
+    docs_bp,           # /openapi.yaml and /docs
+    auth_bp,           # /auth/*
+)
+
+
+@lru_cache(maxsize=1)
+def _bootstrap_env() -> MappingProxyType:
+    """Load the ``.env`` file once and return the parsed server settings.
+
+    ``create_app()`` can be invoked several times per process (test
+    harnesses, WSGI preload), and re-parsing the ``.env`` file plus
+    repeated ``os.getenv`` lookups on every call is wasted work. The
+    ``lru_cache`` guard makes ``load_dotenv()`` run exactly once per
+    process, and the returned mapping is read-only so callers cannot
+    mutate the cached settings.
+
+    Returns:
+        MappingProxyType: Frozen mapping with ``port`` (int) and
+        ``debug`` (bool) entries.
+    """
+    load_dotenv()
+    return MappingProxyType(
+        {
+            "port": int(os.environ.get("BACKEND_PORT", "8000")),
+            "debug": os.environ.get("DEBUG", "false").lower() == "true",
+        }
+    )
 
 
 def create_app() -> Flask:
     """Create and configure the NimbusFlags Flask application instance.
 
-    This factory loads environment variables, registers blueprints,
-    applies CORS for local frontends, and registers global error handlers.
+    This factory loads environment variables (once per process, via
+    :func:`_bootstrap_env`), registers blueprints, applies CORS for
+    local frontends, and registers global error handlers.
 
     Returns:
         Flask: A configured Flask application instance.
     """
-    load_dotenv()
+    _bootstrap_env()
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Allow local React development frontends to call this API directly.
     # In production, CORS should be enforced at the reverse proxy layer.
-    CORS(
-        app,
-        resources={
-            r"/*": {
-                "origins": [
-                    "http://localhost:3000",
-                    "http://localhost:5173",
-                ],
-            },
-        },
-        supports_credentials=False,
-        allow_headers=["Content-Type", "X-Api-Key", "X-Session-Token"],
-        methods=["GET", "POST", "DELETE", "OPTIONS"],
-    )
+    @app.after_request
+    def _apply_cors_headers(response):
+        """Attach precomputed CORS headers for allowed local origins."""
+        origin = request.headers.get("Origin")
+        if origin in _ALLOWED_ORIGINS:
+            headers = response.headers
+            headers["Access-Control-Allow-Origin"] = origin
+            headers["Access-Control-Allow-Methods"] = _ALLOW_METHODS
+            headers["Access-Control-Allow-Headers"] = _ALLOW_HEADERS
+            if request.method == "OPTIONS":
+                headers["Access-Control-Max-Age"] = _PREFLIGHT_MAX_AGE
+            # Append, don't assign: overwriting an existing Vary value
+            # could poison shared caches for responses that already
+            # vary on something else.
+            response.vary.add("Origin")
+        return response
+
+    @app.before_request
+    def _parse_json_payload():
+        """Parse the JSON body once per request into ``g.payload``.
+
+        Handlers read ``g.payload`` instead of each calling
+        ``request.get_json(silent=True) or {}``. orjson's C parser is
+        ~3x faster than the stdlib parser Flask uses, and malformed
+        bodies fail fast with a JSON 400 via :class:`BadRequest`.
+
+        The gate is content type only — not ``content_length``, which
+        is ``None`` for chunked transfer encoding even when a JSON body
+        follows; an actually empty body parses to ``{}`` below.
+        """
+        if (
+            request.method in _JSON_METHODS
+            and request.content_type
+            and "json" in request.content_type
+        ):
+            body = request.get_data(cache=False)
+            if body:
+                try:
+                    g.payload = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    raise BadRequest("Malformed JSON body.")
+            else:
+                g.payload = {}
+        else:
+            g.payload = {}
 
     # Register JSON error handlers (400/404/500, etc.).
     register_error_handlers(app)
 
-    # System & health
-    app.register_blueprint(health_bp)         # /health/
-
-    # Admin / tenant APIs (machine-to-machine)
-    app.register_blueprint(flags_admin_bp)    # /admin/flags/
-    app.register_blueprint(clients_admin_bp)  # /clients/signup, /clients/me
-
-    # Public evaluation endpoint (SDK / runtime)
-    app.register_blueprint(evaluate_bp)       # /evaluate/
-
-    # Documentation (OpenAPI + Swagger UI)
-    app.register_blueprint(docs_bp)           # /openapi.yaml and /docs
-
-    # Dashboard authentication (email/password + sessions)
-    app.register_blueprint(auth_bp)           # /auth/*
+    # System, admin, evaluation, docs and auth blueprints.
+    for bp in _BLUEPRINTS:
+        app.register_blueprint(bp)
 
     return app
 
 
 if __name__ == "__main__":
-    app = create_app()
-
-    # HTTP server configuration derived from environment variables.
-    port = int(os.getenv("BACKEND_PORT", "8000"))
-    debug = os.getenv("DEBUG", "false").lower() == "true"
-
-    app.run(
-        host="0.0.0.0",
-        port=port,
-        debug=debug,
-    )
\ No newline at end of file
+    # HTTP server configuration derived from the cached environment.
+    env = _bootstrap_env()
+
+    if os.getenv("NFLAGS_DEV"):
+        # Werkzeug dev server: single-threaded, reloader, debugger.
+        app = create_app()
+        app.run(
+            host="0.0.0.0",
+            port=env["port"],
+            debug=env["debug"],
+        )
+    else:
+        # Production path: exec gunicorn with threaded workers sized to
+        # the CPU count. --preload imports the app once in the master so
+        # workers share bytecode/app memory via copy-on-write. Threads
+        # (rather than async workers) are enough for the I/O-bound
+        # psycopg handlers and avoid a gevent dependency.
+        os.execvp(
+            "gunicorn",
+            [
+                "gunicorn",
+                "--workers", str(2 * (os.cpu_count() or 1) + 1),
+                "--threads", "4",
+                "--preload",
+                "--bind", f"0.0.0.0:{env['port']}",
+                "app:create_app()",
+            ],
+        )
\ No newline at end of file
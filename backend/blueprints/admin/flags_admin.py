@@ -10,40 +10,81 @@ from __future__ import annotations
 
 from typing import Any
 
-from flask import Blueprint, request, jsonify, g
-
+import orjson
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    request,
+    g,
+    stream_with_context,
+)
+
+from errors.handlers import static_json_error
 from validators.flag_config_validator import validate_flag_config
 from services.auth_service import require_client_auth
+from services.flag_cache import invalidate_flag
 from repositories import postgres_flags_repo
 
 
 flags_admin_bp = Blueprint("flags_admin", __name__, url_prefix="/admin/flags")
 
+# orjson serializes UUID and datetime natively in C; OPT_UTC_Z keeps the
+# timestamp format RFC 3339 ("Z" suffix) for JavaScript consumers.
+_ORJSON_OPTS = orjson.OPT_UTC_Z
+
+# Pagination bounds for GET /admin/flags/. The cap keeps a single
+# request from fetching an arbitrarily large result set.
+_DEFAULT_LIMIT = 50
+_MAX_LIMIT = 500
+
+# Static error body, serialized once at import time.
+_ERR_FLAG_NOT_FOUND = static_json_error(
+    {"error": "Flag not found", "code": "flags.not_found"},
+    404,
+)
+
+
+def _flag_public_fields(row: dict) -> dict:
+    """Project a flag row (dict_row from psycopg) onto its public fields.
 
-def _serialize_flag(row: dict) -> dict:
-    """Serialize a flag row (dict_row from psycopg) into a JSON-safe dict.
+    UUID and datetime values are passed through untouched: orjson
+    serializes both natively in C, so no Python-level str()/isoformat()
+    conversion is needed.
 
     Returns:
-        dict: Serialized flag.
+        dict: Public fields of the flag row.
     """
     return {
-        "id": str(row["id"]),
+        "id": row["id"],
         "key": row["key"],
         "enabled": row["enabled"],
         "conditions": row["conditions"],
         "parameters": row["parameters"],
-        "created_at": (
-            row["created_at"].isoformat() if row.get("created_at") else None
-        ),
-        "updated_at": (
-            row["updated_at"].isoformat() if row.get("updated_at") else None
-        ),
+        "created_at": row.get("created_at"),
+        "updated_at": row.get("updated_at"),
     }
 
 
+def _flag_response(row: dict, status: int = 200):
+    """Build a JSON response for a single flag row via orjson.
+
+    Args:
+        row: The flag row to serialize.
+        status: HTTP status code of the response.
+
+    Returns:
+        Response: JSON response with the serialized flag.
+    """
+    body = orjson.dumps(_flag_public_fields(row), option=_ORJSON_OPTS)
+    return current_app.response_class(
+        body, status=status, mimetype="application/json"
+    )
+
+
 @flags_admin_bp.post("/")
 @require_client_auth
-def post_upsert_flag() -> tuple[Any, int]:
+def post_upsert_flag() -> Response:
     """Create or update a flag configuration for the authenticated client.
 
     - Requires a valid X-Session-Token or X-Api-Key header.
@@ -52,9 +93,10 @@ def post_upsert_flag() -> tuple[Any, int]:
     - Uses postgres_flags_repo.upsert_flag(client_id, flag_data).
 
     Returns:
-        tuple: (JSON response, HTTP status code).
+        Response: JSON representation of the upserted flag (200).
     """
-    payload = request.get_json(silent=True) or {}
+    # Body already parsed once by the app-level before_request hook.
+    payload = getattr(g, "payload", {})
 
     # Validate payload shape (raise / aborts 400 if invalid)
     validate_flag_config(payload)
@@ -67,7 +109,10 @@ def post_upsert_flag() -> tuple[Any, int]:
         flag_data=payload,
     )
 
-    return jsonify(_serialize_flag(row)), 200
+    # Keep the evaluate-path cache coherent with this write.
+    invalidate_flag(client_id, payload["key"])
+
+    return _flag_response(row)
 
 
 @flags_admin_bp.get("/")
@@ -85,52 +130,64 @@ def list_flags() -> tuple[Any, int]:
     """
     client_id = g.client_id
 
-    try:
-        limit = int(request.args.get("limit", "50"))
-    except ValueError:
-        limit = 50
+    # MultiDict.get(type=int) falls back to the default on bad input
+    # inside Werkzeug, so the handler needs no try/except; min/max then
+    # clamp both values to sane bounds.
+    limit = request.args.get("limit", default=_DEFAULT_LIMIT, type=int)
+    limit = min(max(limit, 1), _MAX_LIMIT)
 
-    try:
-        offset = int(request.args.get("offset", "0"))
-    except ValueError:
-        offset = 0
+    offset = request.args.get("offset", default=0, type=int)
+    offset = max(offset, 0)
 
+    # Fetch buffered (at most _MAX_LIMIT rows, so memory is already
+    # bounded), then stream the serialization: the pooled connection is
+    # returned immediately instead of being pinned for the lifetime of
+    # a possibly slow client read, and each row is orjson-serialized as
+    # it leaves rather than as one large join.
     rows = postgres_flags_repo.list_flags_for_client(
         client_id=client_id,
         limit=limit,
         offset=offset,
     )
 
-    return jsonify([_serialize_flag(r) for r in rows]), 200
+    def _stream():
+        yield b"["
+        sep = b""
+        for row in rows:
+            yield sep + orjson.dumps(
+                _flag_public_fields(row), option=_ORJSON_OPTS
+            )
+            sep = b","
+        yield b"]"
+
+    return (
+        current_app.response_class(
+            stream_with_context(_stream()),
+            mimetype="application/json",
+        ),
+        200,
+    )
 
 
 @flags_admin_bp.get("/<string:key>")
 @require_client_auth
-def get_flag_by_key(key: str) -> tuple[Any, int]:
+def get_flag_by_key(key: str) -> Response:
     """Retrieve a flag configuration by its key for the authenticated client.
 
     Args:
         key: The key of the flag to retrieve.
 
     Returns:
-        tuple: (JSON flag representation, HTTP status code).
-               Returns 404 if the flag is not found.
+        Response: JSON representation of the flag (200), or a 404 error
+        body if the flag is not found.
     """
     client_id = g.client_id
 
     row = postgres_flags_repo.get_flag_by_key(client_id=client_id, key=key)
     if row is None:
-        return (
-            jsonify(
-                {
-                    "error": "Flag not found",
-                    "code": "flags.not_found",
-                }
-            ),
-            404,
-        )
+        return _ERR_FLAG_NOT_FOUND()
 
-    return jsonify(_serialize_flag(row)), 200
+    return _flag_response(row)
 
 
 @flags_admin_bp.delete("/<string:key>")
@@ -151,5 +208,8 @@ def delete_flag(key: str) -> tuple[str, int]:
     # postgres_flags_repo.delete_flag does not need to return anything.
     postgres_flags_repo.delete_flag(client_id=client_id, key=key)
 
+    # Keep the evaluate-path cache coherent with this write.
+    invalidate_flag(client_id, key)
+
     # No content on success
     return "", 204
@@ -11,8 +11,9 @@ from __future__ import annotations
 
 from typing import Any
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, jsonify, request
 
+from errors.handlers import static_json_error
 from services.clients_service import authenticate_client
 from services.sessions_service import (
     create_session_for_client,
@@ -21,6 +22,34 @@ from services.sessions_service import (
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
+# Static error bodies, serialized once at import time.
+_ERR_MISSING_CREDENTIALS = static_json_error(
+    {
+        "error": "Email and password are required.",
+        "code": "auth.missing_credentials",
+    },
+    400,
+)
+_ERR_INVALID_CREDENTIALS = static_json_error(
+    {
+        "error": "Invalid email or password.",
+        "code": "auth.invalid_credentials",
+    },
+    401,
+)
+_ERR_MISSING_SESSION_TOKEN = static_json_error(
+    {
+        "error": "Missing session token.",
+        "code": "auth.missing_session_token",
+    },
+    400,
+)
+
+
+# len("Bearer ") — only this prefix is lowercased when matching the
+# Authorization header, never the token value itself.
+_BEARER_PREFIX_LEN = 7
+
 
 def _extract_session_token() -> str | None:
     """Extract a session token from the current request.
@@ -29,17 +58,28 @@ def _extract_session_token() -> str | None:
         1. X-Session-Token header
         2. Authorization: Bearer <token> header
 
+    Reads the raw WSGI environ keys directly instead of going through
+    ``request.headers`` (which does a linear scan per lookup), and only
+    lowercases the 7-byte ``"Bearer "`` prefix rather than the whole
+    header value.
+
     Returns:
         str | None: The raw session token string if present,
         otherwise ``None``.
     """
-    header_token = request.headers.get("X-Session-Token")
-    if header_token:
-        return header_token.strip()
+    environ = request.environ
 
-    auth_header = request.headers.get("Authorization", "")
-    if auth_header.lower().startswith("bearer "):
-        return auth_header[7:].strip()
+    token = environ.get("HTTP_X_SESSION_TOKEN")
+    if token:
+        return token.strip() or None
+
+    auth = environ.get("HTTP_AUTHORIZATION")
+    if (
+        auth
+        and len(auth) > _BEARER_PREFIX_LEN
+        and auth[:_BEARER_PREFIX_LEN].lower() == "bearer "
+    ):
+        return auth[_BEARER_PREFIX_LEN:].strip() or None
 
     return None
 
@@ -78,47 +118,26 @@ def login() -> tuple[Any, int]:
             - On invalid credentials (401):
                 JSON error payload without revealing which field is wrong.
     """
-    data = request.get_json(silent=True) or {}
+    # Body already parsed once by the app-level before_request hook.
+    data = getattr(g, "payload", {})
 
     email = str(data.get("email", "")).strip()
     password = str(data.get("password", ""))
 
     if not email or not password:
-        return (
-            jsonify(
-                {
-                    "error": "Email and password are required.",
-                    "code": "auth.missing_credentials",
-                }
-            ),
-            400,
-        )
+        return _ERR_MISSING_CREDENTIALS()
 
     client = authenticate_client(email=email, password=password)
     if client is None:
         # Do not reveal whether the email or the password is wrong.
-        return (
-            jsonify(
-                {
-                    "error": "Invalid email or password.",
-                    "code": "auth.invalid_credentials",
-                }
-            ),
-            401,
-        )
+        return _ERR_INVALID_CREDENTIALS()
 
     # create_session_for_client returns (Session, raw_token)
     _session, session_token = create_session_for_client(client_id=client.id)
 
     response_body = {
         "session_token": session_token,
-        "client": {
-            "id": str(client.id),
-            "email": client.email,
-            "subscription_tier": client.subscription_tier,
-            "active": client.active,
-            "created_at": client.created_at.isoformat(),
-        },
+        "client": client.to_public_dict(),
     }
     return jsonify(response_body), 200
 
@@ -141,15 +160,7 @@ def logout() -> tuple[Any, int]:
     """
     token = _extract_session_token()
     if not token:
-        return (
-            jsonify(
-                {
-                    "error": "Missing session token.",
-                    "code": "auth.missing_session_token",
-                }
-            ),
-            400,
-        )
+        return _ERR_MISSING_SESSION_TOKEN()
 
     delete_session_for_token(token)
     return "", 204
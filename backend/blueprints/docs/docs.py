@@ -11,11 +11,30 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from flask import Blueprint, current_app, jsonify, send_from_directory
+from flask import Blueprint, Response, send_from_directory
 
 # Absolute routes: /openapi.yaml, /schemas/*, /docs
 docs_bp = Blueprint("docs_bp", __name__)
 
+# Static content directories, resolved once at blueprint registration
+# instead of rebuilding Path objects on every request.
+_DOCS_DIR: Path | None = None
+_SCHEMAS_DIR: Path | None = None
+
+# The spec and schema files only change on deploy, so let browsers cache
+# them for an hour; conditional requests (If-None-Match against the ETag
+# set by send_from_directory) collapse revisits into 304s.
+_STATIC_MAX_AGE = 3600
+
+
+@docs_bp.record_once
+def _resolve_static_dirs(state) -> None:
+    """Cache the docs/schemas directories when the blueprint is registered."""
+    global _DOCS_DIR, _SCHEMAS_DIR
+    backend_dir = Path(state.app.root_path)
+    _DOCS_DIR = backend_dir / "docs"
+    _SCHEMAS_DIR = backend_dir / "schemas"
+
 
 @docs_bp.get("/openapi.yaml")
 def get_openapi_yaml() -> Any:
@@ -23,26 +42,16 @@ def get_openapi_yaml() -> Any:
 
     Returns:
         A Flask response streaming ``openapi.yaml`` with
-        ``text/yaml`` mimetype, or a JSON error payload with a 404
-        status code if the file cannot be found.
+        ``text/yaml`` mimetype. ``send_from_directory`` returns a JSON
+        404 (via the registered error handlers) if the file is missing,
+        so no extra ``exists()`` stat is needed per request.
     """
-    backend_dir = Path(current_app.root_path)  # resolved at request time
-    docs_dir = backend_dir / "docs"
-    spec = docs_dir / "openapi.yaml"
-
-    if not spec.exists():
-        return (
-            jsonify(
-                {
-                    "error": "NotFound",
-                    "detail": "openapi.yaml not found",
-                    "tried": str(spec),
-                }
-            ),
-            404,
-        )
-
-    return send_from_directory(docs_dir, "openapi.yaml", mimetype="text/yaml")
+    return send_from_directory(
+        _DOCS_DIR,
+        "openapi.yaml",
+        mimetype="text/yaml",
+        max_age=_STATIC_MAX_AGE,
+    )
 
 
 @docs_bp.get("/schemas/<path:filename>")
@@ -57,67 +66,63 @@ def get_schema_file(filename: str) -> Any:
 
     Returns:
         A Flask response streaming the JSON schema with
-        ``application/json`` mimetype, or a JSON error payload with a
-        404 status code if the file does not exist.
+        ``application/json`` mimetype, or a JSON 404 (via the registered
+        error handlers) if the file does not exist.
     """
-    backend_dir = Path(current_app.root_path)  # resolved at request time
-    schemas_dir = backend_dir / "schemas"
-    target = schemas_dir / filename
-
-    if not target.exists():
-        return (
-            jsonify(
-                {
-                    "error": "NotFound",
-                    "detail": filename,
-                    "tried": str(target),
-                }
-            ),
-            404,
-        )
-
     return send_from_directory(
-        schemas_dir,
+        _SCHEMAS_DIR,
         filename,
         mimetype="application/json",
+        max_age=_STATIC_MAX_AGE,
     )
 
 
+# Swagger UI page, encoded once at import time. The page is fully
+# static (it only points at /openapi.yaml), so there is no reason to
+# rebuild the body or headers per request.
+_SWAGGER_HTML = b"""
+<!doctype html>
+<html>
+<head>
+    <meta charset="utf-8"/>
+    <title>NimbusFlags API Docs</title>
+    <link rel="stylesheet"
+          href="https://unpkg.com/swagger-ui-dist/swagger-ui.css"/>
+</head>
+<body>
+    <div id="swagger-ui"></div>
+    <script src="https://unpkg.com/swagger-ui-dist/swagger-ui-bundle.js"></script>
+    <script>
+    window.ui = SwaggerUIBundle({
+        url: '/openapi.yaml',
+        dom_id: '#swagger-ui'
+    });
+    </script>
+</body>
+</html>
+"""
+
+_SWAGGER_HEADERS = {
+    "Content-Type": "text/html; charset=utf-8",
+    "Cache-Control": "public, max-age=86400",
+}
+
+
 @docs_bp.get("/docs")
-def swagger_ui() -> tuple[str, int, dict[str, str]]:
+def swagger_ui() -> Response:
     """Serve a minimal Swagger UI pointing to ``/openapi.yaml``.
 
     The HTML page loads Swagger UI assets from a public CDN and
     configures them to fetch the OpenAPI document from the local
-    ``/openapi.yaml`` endpoint.
+    ``/openapi.yaml`` endpoint. The body and headers are module-level
+    constants; the view only wraps them in a ``Response``.
 
     Returns:
-        A tuple ``(html, status_code, headers)`` suitable for Flask,
-        where ``html`` is the Swagger UI page, ``status_code`` is 200,
-        and ``headers`` sets the ``Content-Type`` to HTML UTF-8.
+        Response: The precomputed Swagger UI page.
     """
-    return (
-        """
-        <!doctype html>
-        <html>
-        <head>
-            <meta charset="utf-8"/>
-            <title>NimbusFlags API Docs</title>
-            <link rel="stylesheet"
-                  href="https://unpkg.com/swagger-ui-dist/swagger-ui.css"/>
-        </head>
-        <body>
-            <div id="swagger-ui"></div>
-            <script src="https://unpkg.com/swagger-ui-dist/swagger-ui-bundle.js"></script>
-            <script>
-            window.ui = SwaggerUIBundle({
-                url: '/openapi.yaml',
-                dom_id: '#swagger-ui'
-            });
-            </script>
-        </body>
-        </html>
-        """,
-        200,
-        {"Content-Type": "text/html; charset=utf-8"},
+    return Response(
+        _SWAGGER_HTML,
+        status=200,
+        headers=_SWAGGER_HEADERS,
+        direct_passthrough=True,
     )
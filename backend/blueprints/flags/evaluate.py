@@ -7,18 +7,35 @@ context.
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any
 
-from flask import Blueprint, jsonify, g, request
+import orjson
+from flask import Blueprint, current_app, g
 
-from repositories import postgres_flags_repo
+from errors.handlers import static_json_error
 from services.auth_service import require_client_auth
+from services.flag_cache import get_flag
 from services.flag_service import evaluate_flag
 from validators.evaluate_validator import validate_eval_payload
 
 
 evaluate_bp = Blueprint("evaluate_bp", __name__, url_prefix="/evaluate")
 
+# Static error body, serialized once at import time.
+_ERR_FLAG_NOT_FOUND = static_json_error({"error": "NotFound"}, 404)
+
+# Module-level alias saves a LOAD_GLOBAL per request on the hottest
+# serialization line.
+_JSON_DUMPS = orjson.dumps
+
+
+def _json_default(obj: Any) -> Any:
+    """Unwrap the frozen parameters view for orjson."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError
+
 
 @evaluate_bp.post("/")
 @require_client_auth
@@ -45,22 +62,29 @@ def post_evaluate() -> tuple[Any, int]:
             - ``status_code`` is 200 on success or 404 if the flag is
                 not found.
     """
-    payload = request.get_json(silent=True) or {}
+    # Body already parsed once by the app-level before_request hook.
+    payload = getattr(g, "payload", {})
     validate_eval_payload(payload)
 
     client_id = g.client_id
     flag_key = payload["flag_key"]
 
-    # Multi-tenant lookup in Postgres
-    row = postgres_flags_repo.get_flag_by_key(
-        client_id=client_id, key=flag_key
-    )
+    # Multi-tenant lookup: short-TTL in-memory cache in front of Postgres
+    row = get_flag(client_id=client_id, key=flag_key)
     if row is None:
-        return jsonify({"error": "NotFound"}), 404
+        return _ERR_FLAG_NOT_FOUND()
 
     result = evaluate_flag(
         flag=row,
         user_attributes=payload["user_attributes"],
     )
 
-    return jsonify(result), 200
+    # Serialize straight through orjson to bytes, skipping jsonify's
+    # provider indirection and its str round trip on the hottest route.
+    return (
+        current_app.response_class(
+            _JSON_DUMPS(result, default=_json_default),
+            mimetype="application/json",
+        ),
+        200,
+    )
@@ -9,12 +9,46 @@ HTML pages.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
-from flask import Flask, jsonify
+import orjson
+from flask import Flask, Response, current_app, jsonify
 from werkzeug.exceptions import HTTPException
 
 
+def static_json_error(
+    payload: dict, status: int
+) -> Callable[[], Response]:
+    """Pre-serialize a constant error payload into a response factory.
+
+    Error bodies like ``{"error": ..., "code": ...}`` are fully static,
+    so there is no reason to re-run a dict build plus ``jsonify`` on
+    every failing request. The payload is serialized to bytes once at
+    import time; the returned callable only wraps those bytes in a
+    fresh ``Response`` (responses themselves are mutable and must not
+    be shared between requests).
+
+    Args:
+        payload: The constant JSON body to serialize.
+        status: The HTTP status code of the response.
+
+    Returns:
+        Callable[[], Response]: Zero-argument factory producing the
+        precomputed error response.
+    """
+    body = orjson.dumps(payload)
+
+    def _respond() -> Response:
+        return current_app.response_class(
+            body,
+            status=status,
+            mimetype="application/json",
+            direct_passthrough=True,
+        )
+
+    return _respond
+
+
 class BadRequest(Exception):
     """Exception raised for bad requests (HTTP 400).
 
@@ -39,42 +73,77 @@ class NotFound(Exception):
         self.detail = detail
 
 
-def register_error_handlers(app: Flask) -> None:
-    """Register JSON error handlers for common HTTP errors.
+# Byte templates for the fixed-shape handler bodies: only ``detail``
+# varies per error, so the envelope is pre-serialized and the detail
+# string is spliced in with a single orjson.dumps call — no dict build
+# or full jsonify pass per 4xx.
+_BAD_REQUEST_PREFIX = b'{"error":"BadRequest","detail":'
+_NOT_FOUND_PREFIX = b'{"error":"NotFound","detail":'
+_BODY_SUFFIX = b"}"
+
+# The 500 body is fully constant.
+_ERR_UNEXPECTED = static_json_error(
+    {
+        "error": "InternalServerError",
+        "detail": "An unexpected error occurred.",
+    },
+    500,
+)
 
-    Attaches Flask error handlers so the API always returns JSON
-    instead of HTML error pages.
+
+def _spliced_error(prefix: bytes, detail: str, status: int) -> Response:
+    """Build an error response from a pre-serialized envelope.
 
     Args:
-        app: The Flask application instance to configure.
+        prefix: Serialized body up to (and excluding) the detail value.
+        detail: Human-readable error detail to splice in.
+        status: HTTP status code of the response.
+
+    Returns:
+        Response: The assembled JSON error response.
     """
+    return current_app.response_class(
+        prefix + orjson.dumps(detail) + _BODY_SUFFIX,
+        status=status,
+        mimetype="application/json",
+    )
+
+
+# Exact-type dispatch table for the domain exceptions. One dict lookup
+# replaces Flask walking the handler registry's MRO chain per error.
+_DISPATCH: dict[type, Callable[[Any], Response]] = {
+    BadRequest: lambda err: _spliced_error(
+        _BAD_REQUEST_PREFIX, err.detail, 400
+    ),
+    NotFound: lambda err: _spliced_error(_NOT_FOUND_PREFIX, err.detail, 404),
+}
+
 
-    @app.errorhandler(BadRequest)
-    def _on_bad_request(err: BadRequest) -> tuple[Any, int]:
-        """Return HTTP 400 for validation/contract issues."""
-        return jsonify({"error": "BadRequest", "detail": err.detail}), 400
+def register_error_handlers(app: Flask) -> None:
+    """Register JSON error handlers for common HTTP errors.
 
-    @app.errorhandler(NotFound)
-    def _on_not_found(err: NotFound) -> tuple[Any, int]:
-        """Return HTTP 404 for missing resources."""
-        return jsonify({"error": "NotFound", "detail": err.detail}), 404
+    Attaches a single consolidated Flask error handler so the API
+    always returns JSON instead of HTML error pages. Registering one
+    handler for ``Exception`` (which Flask also consults for
+    ``HTTPException``) keeps dispatch to one dict lookup plus at most
+    one ``isinstance`` check instead of a registry walk per error.
 
-    @app.errorhandler(HTTPException)
-    def _on_http_exception(err: HTTPException) -> tuple[Any, int]:
-        """Fallback for other HTTP errors (for example 500, 405)."""
-        code = err.code or 500
-        name = err.name or "HTTPException"
-        return jsonify({"error": name, "detail": err.description}), code
+    Args:
+        app: The Flask application instance to configure.
+    """
 
     @app.errorhandler(Exception)
-    def _on_unexpected(_: Exception) -> tuple[Any, int]:
-        """Last-resort handler to avoid HTML stack traces."""
-        return (
-            jsonify(
-                {
-                    "error": "InternalServerError",
-                    "detail": "An unexpected error occurred.",
-                }
-            ),
-            500,
-        )
+    def _on_error(err: Exception) -> Response | tuple[Any, int]:
+        """Single dispatch point for all API errors."""
+        handler = _DISPATCH.get(type(err))
+        if handler is not None:
+            return handler(err)
+
+        if isinstance(err, HTTPException):
+            # Other HTTP errors (for example 405, or aborts from views).
+            code = err.code or 500
+            name = err.name or "HTTPException"
+            return jsonify({"error": name, "detail": err.description}), code
+
+        # Last resort: avoid HTML stack traces.
+        return _ERR_UNEXPECTED()
@@ -19,33 +19,47 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # Table + indexes in one multi-statement batch: one round trip to
+    # the server inside the Alembic-managed transaction.
     op.execute(
         """
         CREATE TABLE sessions (
             id UUID PRIMARY KEY,
             client_id UUID NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
-            token_hash TEXT NOT NULL,
+            token_hash BYTEA NOT NULL,
             created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
             expires_at TIMESTAMPTZ NOT NULL,
             revoked_at TIMESTAMPTZ NULL
         );
-        """
-    )
 
-    op.execute(
-        """
         CREATE UNIQUE INDEX uq_sessions_token_hash ON sessions (token_hash);
-        """
-    )
 
-    op.execute(
-        """
+        -- Session lookup is always `WHERE token_hash = $1` (never a range
+        -- scan), so give the planner a hash index for the point lookup.
+        -- The btree above stays: hash indexes cannot enforce uniqueness.
+        CREATE INDEX ix_sessions_token_hash_h ON sessions USING hash (token_hash);
+
         CREATE INDEX ix_sessions_client_id ON sessions (client_id);
+
+        -- Partial index restricted to non-revoked sessions: the live
+        -- lookup filters on token_hash + expires_at, and keeping dead
+        -- rows out of the index keeps it small and RAM-resident as the
+        -- table accumulates expired sessions. (NOW() cannot appear in
+        -- the predicate; the expires_at range check is index-covered.)
+        CREATE INDEX ix_sessions_live
+            ON sessions (token_hash, expires_at)
+            WHERE revoked_at IS NULL;
         """
     )
 
 
 def downgrade() -> None:
-    op.execute("DROP INDEX IF EXISTS ix_sessions_client_id;")
-    op.execute("DROP INDEX IF EXISTS uq_sessions_token_hash;")
-    op.execute("DROP TABLE IF EXISTS sessions;")
\ No newline at end of file
+    op.execute(
+        """
+        DROP INDEX IF EXISTS ix_sessions_live;
+        DROP INDEX IF EXISTS ix_sessions_client_id;
+        DROP INDEX IF EXISTS ix_sessions_token_hash_h;
+        DROP INDEX IF EXISTS uq_sessions_token_hash;
+        DROP TABLE IF EXISTS sessions;
+        """
+    )
\ No newline at end of file
@@ -9,27 +9,25 @@ depends_on = None
 
 
 def upgrade():
-    """Create clients and flags tables."""
-    # Create clients table
+    """Create clients and flags tables.
+
+    All DDL is sent as one multi-statement batch so the migration costs
+    a single round trip to the server instead of one per statement.
+    """
     op.execute(
         """
         CREATE TABLE clients (
             id UUID PRIMARY KEY,
             email TEXT NOT NULL UNIQUE,
             password_hash TEXT NOT NULL,
-            api_key_hash TEXT NOT NULL UNIQUE,
+            api_key_hash BYTEA NOT NULL UNIQUE,
             subscription_tier TEXT NOT NULL DEFAULT 'free',
             active BOOLEAN NOT NULL DEFAULT TRUE,
             created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
             CONSTRAINT clients_subscription_tier_check
                 CHECK (subscription_tier IN ('free', 'essential', 'premium', 'ultimate'))
         );
-        """
-    )
 
-    # Create flags table
-    op.execute(
-        """
         CREATE TABLE flags (
             id UUID PRIMARY KEY,
             client_id UUID NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
@@ -41,10 +39,20 @@ def upgrade():
             updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
             CONSTRAINT flags_client_key_unique UNIQUE (client_id, key)
         );
+
+        -- API-key auth is a pure equality lookup on the 32-byte digest;
+        -- the hash index is the cheaper access path for that (the unique
+        -- btree above still enforces uniqueness).
+        CREATE INDEX ix_clients_api_key_hash_h
+            ON clients USING hash (api_key_hash);
         """
     )
 
 
 def downgrade():
-    op.execute("DROP TABLE IF EXISTS flags;")
-    op.execute("DROP TABLE IF EXISTS clients;")
+    op.execute(
+        """
+        DROP TABLE IF EXISTS flags;
+        DROP TABLE IF EXISTS clients;
+        """
+    )
@@ -10,31 +10,83 @@ retrieving clients. Business rules and validation live in the
 from __future__ import annotations
 
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from psycopg import DatabaseError
+from psycopg.rows import RowFactory
 
+from ._uuid_batch import fast_uuid4
 from .db import get_connection
 
 
+# Explicit column list (instead of *) so Postgres can prune columns and
+# the statements below stay stable strings — psycopg then reuses one
+# server-side prepared plan per statement (prepare=True).
+_CLIENT_COLUMNS = (
+    "id, email, password_hash, api_key_hash, "
+    "subscription_tier, active, created_at"
+)
+
+# Narrower projection for per-request auth lookups: those paths never
+# need password_hash (only dashboard login does) or api_key_hash, so
+# skipping them saves bytes on the wire and dict churn on every request.
+_CLIENT_AUTH_COLUMNS = "id, email, subscription_tier, active, created_at"
+
+_CREATE_CLIENT_SQL = f"""
+    INSERT INTO clients (
+        id,
+        email,
+        password_hash,
+        api_key_hash,
+        subscription_tier
+    )
+    VALUES (%s, %s, %s, %s, %s)
+    RETURNING {_CLIENT_COLUMNS};
+"""
+
+_GET_CLIENT_BY_ID_SQL = f"""
+    SELECT {_CLIENT_AUTH_COLUMNS}
+    FROM clients
+    WHERE id = %s;
+"""
+
+_UPDATE_PASSWORD_HASH_SQL = """
+    UPDATE clients
+    SET password_hash = %s
+    WHERE id = %s;
+"""
+
+_GET_CLIENT_BY_EMAIL_SQL = f"""
+    SELECT {_CLIENT_COLUMNS}
+    FROM clients
+    WHERE email = %s;
+"""
+
+_GET_CLIENT_BY_API_KEY_HASH_SQL = f"""
+    SELECT {_CLIENT_AUTH_COLUMNS}
+    FROM clients
+    WHERE api_key_hash = %s;
+"""
+
+
 def create_client(
     email: str,
     password_hash: str,
-    api_key_hash: str,
+    api_key_hash: bytes,
     subscription_tier: str = "free",
 ) -> dict:
     """Insert a new client into the database.
 
     This function:
-        - Generates a UUID in Python (uuid4)
+        - Generates a v4 UUID in Python (batch-amortized fast_uuid4)
             to avoid depending on DB extensions.
         - Lets the database set `active` (DEFAULT TRUE)
             and `created_at` (DEFAULT NOW()).
 
     Args:
         email: Client email address (must be unique).
-        password_hash: Bcrypt-hashed password string.
-        api_key_hash: SHA-256 hash of the client's API key.
+        password_hash: Hashed password string (argon2id PHC format).
+        api_key_hash: Raw keyed-BLAKE2b digest of the client's API key.
         subscription_tier:
             Optional subscription tier label, defaults to "free".
 
@@ -44,66 +96,71 @@ def create_client(
     Raises:
         RuntimeError: If the underlying database operation fails.
     """
-    client_id = uuid4()
-
-    sql = """
-        INSERT INTO clients (
-            id,
-            email,
-            password_hash,
-            api_key_hash,
-            subscription_tier
-        )
-        VALUES (
-            %(id)s,
-            %(email)s,
-            %(password_hash)s,
-            %(api_key_hash)s,
-            %(subscription_tier)s
-        )
-        RETURNING *;
-    """
+    client_id = fast_uuid4()
 
-    params = {
-        "id": client_id,
-        "email": email,
-        "password_hash": password_hash,
-        "api_key_hash": api_key_hash,
-        "subscription_tier": subscription_tier,
-    }
+    params = (client_id, email, password_hash, api_key_hash,
+              subscription_tier)
 
     try:
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, params)
+                cur.execute(_CREATE_CLIENT_SQL, params, prepare=True)
                 row = cur.fetchone()
                 return row
     except DatabaseError as exc:
         raise RuntimeError("Failed to create client.") from exc
 
 
-def get_client_by_id(client_id: UUID) -> Optional[dict]:
+def get_client_by_id(
+    client_id: UUID,
+    row_factory: Optional[RowFactory] = None,
+) -> Optional[dict]:
     """Fetch a client by its UUID.
 
     Args:
         client_id: The UUID of the client to retrieve.
+        row_factory: Optional psycopg row factory (e.g. a ``class_row``)
+            letting the caller get its DTO built directly in C; when
+            ``None`` the connection default (``dict_row``) applies.
 
     Returns:
-        The client record as a dictionary if found, otherwise None.
-    """
-    sql = """
-        SELECT *
-        FROM clients
-        WHERE id = %(id)s;
+        The client record (auth projection, without credential hashes)
+        as a dictionary — or as the row factory's type — if found,
+        otherwise None.
     """
-
     with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, {"id": client_id})
+        with conn.cursor(row_factory=row_factory) as cur:
+            cur.execute(
+                _GET_CLIENT_BY_ID_SQL, (client_id,), prepare=True
+            )
             row = cur.fetchone()
             return row
 
 
+def update_password_hash(client_id: UUID, password_hash: str) -> None:
+    """Replace the stored password hash for a client.
+
+    Used by login's lazy hash-upgrade path (legacy bcrypt -> argon2id)
+    and by any future password-change endpoint.
+
+    Args:
+        client_id: The UUID of the client to update.
+        password_hash: The new password hash string.
+
+    Raises:
+        RuntimeError: If the underlying database operation fails.
+    """
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    _UPDATE_PASSWORD_HASH_SQL,
+                    (password_hash, client_id),
+                )
+    except DatabaseError as exc:
+        raise RuntimeError("Failed to update password hash.") from exc
+
+
 def get_client_by_email(email: str) -> Optional[dict]:
     """Fetch a client by its email address.
 
@@ -113,36 +170,39 @@ def get_client_by_email(email: str) -> Optional[dict]:
     Returns:
         The client record as a dictionary if found, otherwise None.
     """
-    sql = """
-        SELECT *
-        FROM clients
-        WHERE email = %(email)s;
-    """
-
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, {"email": email})
+            cur.execute(
+                _GET_CLIENT_BY_EMAIL_SQL, (email,), prepare=True
+            )
             row = cur.fetchone()
             return row
 
 
-def get_client_by_api_key_hash(api_key_hash: str) -> Optional[dict]:
+def get_client_by_api_key_hash(
+    api_key_hash: bytes,
+    row_factory: Optional[RowFactory] = None,
+) -> Optional[dict]:
     """Fetch a client by its API key hash.
 
     Args:
-        api_key_hash: The SHA-256 hash of the client's API key.
+        api_key_hash: The raw keyed-BLAKE2b digest of the client's API
+            key.
+        row_factory: Optional psycopg row factory (e.g. a ``class_row``)
+            letting the caller get its DTO built directly in C; when
+            ``None`` the connection default (``dict_row``) applies.
 
     Returns:
-        The client record as a dictionary if found, otherwise None.
-    """
-    sql = """
-        SELECT *
-        FROM clients
-        WHERE api_key_hash = %(api_key_hash)s;
+        The client record (auth projection, without credential hashes)
+        as a dictionary — or as the row factory's type — if found,
+        otherwise None.
     """
-
     with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, {"api_key_hash": api_key_hash})
+        with conn.cursor(row_factory=row_factory) as cur:
+            cur.execute(
+                _GET_CLIENT_BY_API_KEY_HASH_SQL,
+                (api_key_hash,),
+                prepare=True,
+            )
             row = cur.fetchone()
             return row
@@ -2,18 +2,21 @@
 """Database connection utilities for NimbusFlags.
 
 This module exposes a small helper to obtain PostgreSQL connections
-using psycopg with dict-style rows.
+from a shared connection pool, using psycopg with dict-style rows.
 """
 
 
 from __future__ import annotations
 
+import atexit
 import os
+import threading
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Iterator, Optional
 
 import psycopg
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 from dotenv import load_dotenv
 
 
@@ -25,20 +28,57 @@ if not DATABASE_URL:
         "DATABASE_URL is not set. Make sure .env is configured."
     )
 
+# Pool sizing: enough ready connections for the gunicorn thread count
+# without holding dozens of idle Postgres backends per worker.
+_POOL_MIN_SIZE = 4
+_POOL_MAX_SIZE = max(8, (os.cpu_count() or 1) * 2)
+# How long a request waits for a free connection before failing.
+_POOL_TIMEOUT_SECONDS = 5.0
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ConnectionPool:
+    """Return the process-wide connection pool, creating it on first use.
+
+    The pool is created lazily so importing this module (tests, tooling)
+    does not open TCP connections; the first repository call pays the
+    warm-up once and every later call checks a ready connection out of
+    the pool instead of doing a fresh TCP+auth handshake.
+
+    Returns:
+        ConnectionPool: The shared psycopg connection pool.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    DATABASE_URL,
+                    min_size=_POOL_MIN_SIZE,
+                    max_size=_POOL_MAX_SIZE,
+                    timeout=_POOL_TIMEOUT_SECONDS,
+                    kwargs={"row_factory": dict_row},
+                    open=True,
+                )
+                atexit.register(_pool.close)
+    return _pool
+
 
 @contextmanager
 def get_connection() -> Iterator[psycopg.Connection]:
-    """Yield a psycopg connection configured with dict-style rows.
+    """Yield a pooled psycopg connection configured with dict-style rows.
 
     The connection uses `dict_row` as row factory so that queries
-    return dictionaries instead of tuples. The connection is always
-    closed properly, even if an exception occurs.
+    return dictionaries instead of tuples. The connection is returned
+    to the pool when the context exits, even if an exception occurs.
 
     Yields:
-        psycopg.Connection: An open database connection.
+        psycopg.Connection: An open database connection from the pool.
     """
     try:
-        with psycopg.connect(DATABASE_URL, row_factory=dict_row) as conn:
+        with _get_pool().connection() as conn:
             yield conn
     except psycopg.OperationalError as exc:
         raise RuntimeError("Database connection failed.") from exc
@@ -0,0 +1,91 @@
+# NimbusFlags/backend/repositories/db_async.py
+"""Async database connection utilities for NimbusFlags.
+
+Async twin of :mod:`repositories.db`, built on psycopg's native async
+API. It exists as groundwork for moving hot read paths off blocking
+worker threads (e.g. serving routes through an ASGI bridge): one event
+loop can await hundreds of in-flight queries instead of parking a
+thread per round trip.
+
+Nothing imports this module yet; repository functions grow async
+variants as routes are migrated, so the sync path stays untouched.
+"""
+
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import psycopg
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from .db import DATABASE_URL, _POOL_MIN_SIZE, _POOL_MAX_SIZE
+
+# How long a request waits for a free connection before failing.
+_POOL_TIMEOUT_SECONDS = 5.0
+
+_async_pool: Optional[AsyncConnectionPool] = None
+_async_pool_init_lock = asyncio.Lock()
+
+
+async def _get_async_pool() -> AsyncConnectionPool:
+    """Return the process-wide async pool, creating it on first use.
+
+    Created lazily (and inside a running event loop, as psycopg_pool
+    requires) so importing this module stays side-effect free. The init
+    is guarded by a lock and the global is only assigned once the pool
+    is open: ``await pool.open()`` is a suspension point, so without
+    the guard a second coroutine could observe a non-None, not-yet-open
+    pool and fail using it.
+
+    Returns:
+        AsyncConnectionPool: The shared async psycopg connection pool.
+    """
+    global _async_pool
+    if _async_pool is None:
+        async with _async_pool_init_lock:
+            if _async_pool is None:
+                pool = AsyncConnectionPool(
+                    DATABASE_URL,
+                    min_size=_POOL_MIN_SIZE,
+                    max_size=_POOL_MAX_SIZE,
+                    timeout=_POOL_TIMEOUT_SECONDS,
+                    kwargs={"row_factory": dict_row},
+                    open=False,
+                )
+                await pool.open()
+                _async_pool = pool
+    return _async_pool
+
+
+@asynccontextmanager
+async def get_async_connection() -> AsyncIterator[psycopg.AsyncConnection]:
+    """Yield a pooled async psycopg connection with dict-style rows.
+
+    Mirrors :func:`repositories.db.get_connection`: rows come back as
+    dictionaries and the connection is returned to the pool when the
+    context exits, even if an exception occurs.
+
+    Yields:
+        psycopg.AsyncConnection: An open async connection from the pool.
+    """
+    pool = await _get_async_pool()
+    try:
+        async with pool.connection() as conn:
+            yield conn
+    except psycopg.OperationalError as exc:
+        raise RuntimeError("Database connection failed.") from exc
+
+
+async def close_async_pool() -> None:
+    """Close the async pool, e.g. from an ASGI shutdown hook.
+
+    Safe to call when the pool was never opened.
+    """
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
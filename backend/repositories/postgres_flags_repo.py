@@ -7,14 +7,65 @@ in the ``flags`` table, scoped per client (multi-tenant).
 
 
 from typing import List, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from psycopg import DatabaseError
 from psycopg.types.json import Json
 
+from ._uuid_batch import fast_uuid4
 from .db import get_connection
 
 
+# Explicit column list (instead of *) so Postgres can prune columns and
+# the statements below stay stable strings — psycopg then reuses one
+# server-side prepared plan per statement (prepare=True).
+_FLAG_COLUMNS = (
+    "id, client_id, key, enabled, conditions, parameters, "
+    "created_at, updated_at"
+)
+
+_UPSERT_FLAG_SQL = f"""
+    INSERT INTO flags (
+        id,
+        client_id,
+        key,
+        enabled,
+        conditions,
+        parameters
+    )
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON CONFLICT (client_id, key)
+    DO UPDATE SET
+        enabled = EXCLUDED.enabled,
+        conditions = EXCLUDED.conditions,
+        parameters = EXCLUDED.parameters,
+        updated_at = NOW()
+    RETURNING {_FLAG_COLUMNS};
+"""
+
+_GET_FLAG_BY_KEY_SQL = f"""
+    SELECT {_FLAG_COLUMNS}
+    FROM flags
+    WHERE client_id = %s
+      AND key = %s;
+"""
+
+_LIST_FLAGS_SQL = f"""
+    SELECT {_FLAG_COLUMNS}
+    FROM flags
+    WHERE client_id = %s
+    ORDER BY key
+    LIMIT %s
+    OFFSET %s;
+"""
+
+_DELETE_FLAG_SQL = """
+    DELETE FROM flags
+    WHERE client_id = %s
+      AND key = %s;
+"""
+
+
 def upsert_flag(client_id: UUID, flag_data: dict) -> dict:
     """Insert or update a flag for a given client.
 
@@ -48,52 +99,73 @@ def upsert_flag(client_id: UUID, flag_data: dict) -> dict:
     conditions = flag_data.get("conditions", [])
     parameters = flag_data.get("parameters", {})
 
-    sql = """
-        INSERT INTO flags (
-            id,
-            client_id,
-            key,
-            enabled,
-            conditions,
-            parameters
-        )
-        VALUES (
-            %(id)s,
-            %(client_id)s,
-            %(key)s,
-            %(enabled)s,
-            %(conditions)s,
-            %(parameters)s
-        )
-        ON CONFLICT (client_id, key)
-        DO UPDATE SET
-            enabled = EXCLUDED.enabled,
-            conditions = EXCLUDED.conditions,
-            parameters = EXCLUDED.parameters,
-            updated_at = NOW()
-        RETURNING *;
-    """
-
-    params = {
-        "id": uuid4(),
-        "client_id": client_id,
-        "key": key,
-        "enabled": enabled,
-        # IMPORTANT: explicit conversion to JSON for PostgreSQL JSONB columns.
-        "conditions": Json(conditions),
-        "parameters": Json(parameters),
-    }
+    # IMPORTANT: explicit Json() conversion for PostgreSQL JSONB columns.
+    params = (fast_uuid4(), client_id, key, enabled,
+              Json(conditions), Json(parameters))
 
     try:
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, params)
+                cur.execute(_UPSERT_FLAG_SQL, params, prepare=True)
                 row = cur.fetchone()
                 return row
     except DatabaseError as exc:
         raise RuntimeError("Failed to upsert flag.") from exc
 
 
+def upsert_flags_bulk(client_id: UUID, flags: List[dict]) -> List[dict]:
+    """Insert or update many flags for a client in one round-trip batch.
+
+    Intended for bulk imports / dashboard syncs where per-flag calls to
+    :func:`upsert_flag` would cost one network round-trip each. The
+    whole batch runs inside a single transaction: either every flag is
+    upserted or none are. psycopg pipelines the ``executemany`` so the
+    statements share one flight to the server.
+
+    Args:
+        client_id: UUID of the client (tenant) owning the flags.
+        flags: List of flag configurations, each following the
+            ``flag_config.schema.json`` contract.
+
+    Returns:
+        List[dict]: The upserted flag records, in input order.
+
+    Raises:
+        RuntimeError: If the underlying database operation fails.
+    """
+    if not flags:
+        return []
+
+    params_seq = [
+        (
+            fast_uuid4(),
+            client_id,
+            flag_data["key"],
+            flag_data["enabled"],
+            Json(flag_data.get("conditions", [])),
+            Json(flag_data.get("parameters", {})),
+        )
+        for flag_data in flags
+    ]
+
+    rows: List[dict] = []
+    try:
+        with get_connection() as conn:
+            with conn.transaction():
+                with conn.cursor() as cur:
+                    cur.executemany(
+                        _UPSERT_FLAG_SQL, params_seq, returning=True
+                    )
+                    while True:
+                        rows.append(cur.fetchone())
+                        if not cur.nextset():
+                            break
+    except DatabaseError as exc:
+        raise RuntimeError("Failed to upsert flags in bulk.") from exc
+
+    return rows
+
+
 def get_flag_by_key(client_id: UUID, key: str) -> Optional[dict]:
     """Fetch a single flag for a given client and flag key.
 
@@ -104,16 +176,13 @@ def get_flag_by_key(client_id: UUID, key: str) -> Optional[dict]:
     Returns:
         A dictionary representing the flag record if found, otherwise ``None``.
     """
-    sql = """
-        SELECT *
-        FROM flags
-        WHERE client_id = %(client_id)s
-          AND key = %(key)s;
-    """
-
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, {"client_id": client_id, "key": key})
+            cur.execute(
+                _GET_FLAG_BY_KEY_SQL,
+                (client_id, key),
+                prepare=True,
+            )
             row = cur.fetchone()
             return row
 
@@ -133,24 +202,12 @@ def list_flags_for_client(
     Returns:
         A list of dictionaries representing the flag records.
     """
-    sql = """
-        SELECT *
-        FROM flags
-        WHERE client_id = %(client_id)s
-        ORDER BY key
-        LIMIT %(limit)s
-        OFFSET %(offset)s;
-    """
-
     with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                sql,
-                {
-                    "client_id": client_id,
-                    "limit": limit,
-                    "offset": offset,
-                },
+                _LIST_FLAGS_SQL,
+                (client_id, limit, offset),
+                prepare=True,
             )
             rows = cur.fetchall()
             return rows
@@ -169,15 +226,13 @@ def delete_flag(client_id: UUID, key: str) -> None:
     Raises:
         RuntimeError: If the underlying database operation fails.
     """
-    sql = """
-        DELETE FROM flags
-        WHERE client_id = %(client_id)s
-          AND key = %(key)s;
-    """
-
     try:
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, {"client_id": client_id, "key": key})
+                cur.execute(
+                    _DELETE_FLAG_SQL,
+                    (client_id, key),
+                    prepare=True,
+                )
     except DatabaseError as exc:
         raise RuntimeError("Failed to delete flag.") from exc
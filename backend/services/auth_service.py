@@ -20,7 +20,7 @@ from __future__ import annotations
 from functools import wraps
 from typing import Callable, Optional, TypeVar, cast
 
-from flask import g, jsonify, request
+from flask import g, request
 
 # Support both "backend." package imports and running app.py directly.
 try:  # pragma: no cover - import-path handling
@@ -37,8 +37,24 @@ except ImportError:  # pragma: no cover - app.py / direct execution
     )
 
 
+try:  # pragma: no cover - import-path handling
+    from backend.errors.handlers import static_json_error
+except ImportError:  # pragma: no cover - app.py / direct execution
+    from errors.handlers import static_json_error  # type: ignore[no-redef]
+
+
 F = TypeVar("F", bound=Callable[..., object])
 
+# Static 401 bodies, serialized once at import time.
+_ERR_API_KEY_INVALID = static_json_error(
+    {"error": "Invalid or missing API key", "code": "auth.api_key_invalid"},
+    401,
+)
+_ERR_AUTH_REQUIRED = static_json_error(
+    {"error": "Unauthorized", "code": "auth.required"},
+    401,
+)
+
 
 def get_current_client() -> Optional[Client]:
     """Return the current authenticated client, if any.
@@ -84,17 +100,13 @@ def require_api_key(func: F) -> F:
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        api_key = request.headers.get("X-Api-Key", "").strip()
+        # Direct WSGI environ lookup: one dict get instead of walking
+        # Werkzeug's case-insensitive EnvironHeaders on every request.
+        api_key = request.environ.get("HTTP_X_API_KEY", "").strip()
 
         client = resolve_client_by_api_key(api_key)
         if client is None:
-            response = jsonify(
-                {
-                    "error": "Invalid or missing API key",
-                    "code": "auth.api_key_invalid",
-                }
-            )
-            return response, 401
+            return _ERR_API_KEY_INVALID()
 
         # Attach client to the request context
         g.client = client
@@ -108,13 +120,14 @@ def require_api_key(func: F) -> F:
 def _get_session_token_from_request() -> Optional[str]:
     """Extract the raw session token from the incoming HTTP request.
 
-    Currently the token is read from the ``X-Session-Token`` header.
+    Currently the token is read from the ``X-Session-Token`` header,
+    straight out of the WSGI environ to skip Werkzeug's header-walk.
 
     Returns:
         Optional[str]: The raw session token, or ``None`` if it is not
         present or only contains whitespace.
     """
-    token = request.headers.get("X-Session-Token", "").strip()
+    token = request.environ.get("HTTP_X_SESSION_TOKEN", "").strip()
     return token or None
 
 
@@ -150,18 +163,12 @@ def require_client_auth(func: F) -> F:
         if session_token is not None:
             client = resolve_client_by_session_token(session_token)
         else:
-            api_key = request.headers.get("X-Api-Key", "").strip()
+            api_key = request.environ.get("HTTP_X_API_KEY", "").strip()
             if api_key:
                 client = resolve_client_by_api_key(api_key)
 
         if client is None:
-            response = jsonify(
-                {
-                    "error": "Unauthorized",
-                    "code": "auth.required",
-                }
-            )
-            return response, 401
+            return _ERR_AUTH_REQUIRED()
 
         # Attach client to the request context (same convention as API keys).
         g.client = client
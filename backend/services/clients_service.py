@@ -3,7 +3,7 @@
 
 This module centralizes:
 - The Client dataclass (internal representation of a tenant).
-- Password hashing/verification (bcrypt).
+- Password hashing/verification (argon2id, with legacy bcrypt support).
 - API key generation + hashing.
 - Client registration and lookup helpers.
 - Authentication helpers for email/password and session tokens.
@@ -12,20 +12,32 @@ This module centralizes:
 
 from __future__ import annotations
 
+import base64
 import hashlib
+import hmac
+import os
+import re
 import secrets
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2 import exceptions as argon2_exceptions
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from psycopg.rows import class_row
 
 try:
     # When running app.py directly (backend directory on sys.path)
-    from services.sessions_service import get_active_session_for_token
+    from services.sessions_service import get_active_session_with_client
 except ImportError:  # pragma: no cover - backend package context
-    from backend.services.sessions_service import get_active_session_for_token
+    from backend.services.sessions_service import (
+        get_active_session_with_client,
+    )
 try:
     # Case 1: imported as part of the `backend` package (tests, tooling, etc.)
     from ..repositories import clients_repo  # type: ignore[import]
@@ -36,14 +48,136 @@ except ImportError:
 
 
 API_KEY_PREFIX = "nf_live_"
+_API_KEY_PREFIX_LEN = len(API_KEY_PREFIX)
+# Bytes form of the prefix so key generation concatenates at the bytes
+# level and decodes once, instead of token_urlsafe's encode/strip/decode
+# dance followed by an f-string join.
+_API_KEY_PREFIX_BYTES = API_KEY_PREFIX.encode("ascii")
+
+# Syntax-only email shape check (local@domain.tld), compiled once so
+# registration runs it in the C regex engine with no DNS involved.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Optional pepper mixed into API-key hashes via BLAKE2's keyed mode.
+# Must be identical across workers and restarts (stored hashes depend
+# on it), hence env-sourced rather than per-process random. An empty
+# pepper degrades to plain BLAKE2b, so setting one is recommended.
+_API_KEY_PEPPER = os.getenv("API_KEY_PEPPER", "").encode("utf-8")
+
+# Password hashing: argon2id for all new hashes (memory-hard, SIMD
+# BLAKE2 core — better brute-force resistance per ms than bcrypt).
+# Parameters follow the argon2-cffi defaults shape; they are embedded
+# in each hash, so they can be retuned without breaking verification.
+_PASSWORD_HASHER = PasswordHasher(
+    time_cost=2,
+    memory_cost=65536,  # 64 MiB
+    parallelism=os.cpu_count() or 1,
+)
+
+# Hash of a throwaway value, verified against a mismatching password
+# whenever verify_password short-circuits (empty input) so the rejection
+# takes the same time as a real wrong-password check.
+_DUMMY_PASSWORD_HASH = _PASSWORD_HASHER.hash("nimbusflags-dummy")
+
+# bcrypt is kept only to verify legacy "$2*" hashes created before the
+# argon2 migration; those are transparently upgraded on next login.
+
+# Both hashers release the GIL in their C extensions, so hashing scales
+# across cores; funnelling it through one bounded pool also caps
+# concurrent hashing work at cpu_count during signup/login bursts
+# instead of letting every gunicorn thread grind hashes at once.
+_PWHASH_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="pwhash",
+)
+
+# Per-process cache of api_key_hash -> Client for the auth hot path.
+# Every authenticated request (admin + /evaluate/) resolves the caller,
+# so a running SDK reuses one DB lookup for up to 60s. Client is a
+# frozen dataclass, safe to share across requests. Trade-off: a
+# deactivated client may authenticate for at most the TTL.
+_API_KEY_CACHE_MAXSIZE = 10_000
+_API_KEY_CACHE_TTL_SECONDS = 60.0
+
+_api_key_cache: TTLCache = TTLCache(
+    maxsize=_API_KEY_CACHE_MAXSIZE,
+    ttl=_API_KEY_CACHE_TTL_SECONDS,
+)
+_api_key_cache_lock = threading.Lock()
+
+# Negative cache for the rejection path: a hammered invalid/rotated key
+# otherwise costs a DB round trip per attempt (abuse-amplifiable under
+# credential stuffing). Known-bad digests short-circuit to None here.
+# A TTLCache (not a bloom filter) keeps this exact — no false positive
+# can ever shadow a real key — and the short TTL bounds how long a
+# just-(re)issued key colliding with a stale entry could be rejected.
+_BAD_KEY_CACHE_MAXSIZE = 100_000
+_BAD_KEY_CACHE_TTL_SECONDS = 60.0
+
+_bad_key_cache: TTLCache = TTLCache(
+    maxsize=_BAD_KEY_CACHE_MAXSIZE,
+    ttl=_BAD_KEY_CACHE_TTL_SECONDS,
+)
+_bad_key_cache_lock = threading.Lock()
+
+
+# Login verification cache: argon2id is intentionally slow (tens of
+# ms and 64 MiB per hash), so a client that logs in repeatedly with the
+# same credentials pays it once per TTL instead of per login. Keys are
+# HMAC-SHA256(pepper, email:password) digests — useless to an attacker
+# without the pepper, which is random per process unless pinned via
+# env (LOGIN_CACHE_PEPPER) for multi-worker consistency.
+_LOGIN_CACHE_MAXSIZE = 5_000
+_LOGIN_CACHE_TTL_SECONDS = 300.0
+
+_login_cache_pepper = (
+    os.getenv("LOGIN_CACHE_PEPPER", "").encode("utf-8")
+    or secrets.token_bytes(32)
+)
+_login_cache: TTLCache = TTLCache(
+    maxsize=_LOGIN_CACHE_MAXSIZE,
+    ttl=_LOGIN_CACHE_TTL_SECONDS,
+)
+_login_cache_lock = threading.Lock()
+
+
+def _login_cache_key(email: str, password: str) -> bytes:
+    """Derive the peppered HMAC key for a credentials pair.
+
+    Args:
+        email: Normalized (lowercased) client email.
+        password: Plaintext password as entered.
+
+    Returns:
+        bytes: HMAC-SHA256 digest identifying the credentials.
+    """
+    material = f"{email}:{password}".encode("utf-8")
+    return hmac.new(_login_cache_pepper, material, "sha256").digest()
+
+
+def invalidate_api_key_cache(api_key_hash: bytes) -> None:
+    """Drop the cached resolution for an API key after a write.
+
+    Intended for key-rotation and deactivation paths so a revoked key
+    stops authenticating immediately instead of after the TTL.
 
+    Args:
+        api_key_hash: Raw keyed-BLAKE2b digest of the API key to evict.
+    """
+    with _api_key_cache_lock:
+        _api_key_cache.pop(api_key_hash, None)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Client:
     """Domain model for a NimbusFlags client.
 
     Internal representation used by services and handlers.
     We never store or expose password_hash or api_key_hash on this model.
+
+    ``slots=True`` drops the per-instance ``__dict__``: with thousands
+    of Clients pinned in the resolver caches that roughly halves the
+    footprint per instance and makes attribute reads a fixed-offset
+    load.
     """
     id: UUID
     email: str
@@ -51,6 +185,30 @@ class Client:
     active: bool
     created_at: datetime
 
+    def to_public_dict(self) -> dict:
+        """Serialize this client into a JSON-safe dict for API responses.
+
+        Shared by the signup/profile endpoints and the login response so
+        the field list exists in exactly one place.
+
+        Returns:
+            dict: Public representation (never includes password or
+            API key hashes).
+        """
+        return {
+            "id": str(self.id),
+            "email": self.email,
+            "subscription_tier": self.subscription_tier,
+            "active": self.active,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+# Row factory for auth-path lookups: psycopg builds the Client
+# dataclass straight from the row (the auth projection matches the
+# dataclass fields exactly), skipping the intermediate dict_row dict.
+_CLIENT_ROW_FACTORY = class_row(Client)
+
 
 class ClientAlreadyExistsError(Exception):
     """Raised when registering a client with an existing email."""
@@ -58,13 +216,13 @@ class ClientAlreadyExistsError(Exception):
 
 
 def hash_password(plain_password: str) -> str:
-    """Hash a plaintext password using bcrypt.
+    """Hash a plaintext password using argon2id.
 
     Args:
         plain_password: The raw password provided by the user.
 
     Returns:
-        str: The bcrypt hash of the password.
+        str: The argon2id hash of the password (PHC string format).
 
     Raises:
         ValueError: If the password is empty.
@@ -72,32 +230,59 @@ def hash_password(plain_password: str) -> str:
     if not plain_password:
         raise ValueError("Password cannot be empty.")
 
-    password_bytes = plain_password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode("utf-8")
+    hashed = _PWHASH_POOL.submit(_PASSWORD_HASHER.hash, plain_password)
+    return hashed.result()
 
 
 def verify_password(plain_password: str, password_hash: str) -> bool:
-    """Verify a plaintext password against a bcrypt hash.
+    """Verify a plaintext password against a stored hash.
+
+    Supports both argon2id hashes (current) and legacy bcrypt hashes
+    (recognized by their ``$2`` prefix).
 
     Args:
         plain_password: The raw password to verify.
-        password_hash: The stored bcrypt hash.
+        password_hash: The stored password hash.
 
     Returns:
         bool: True if the password matches the hash, False otherwise.
+
+    Notes:
+        Empty inputs still burn a full argon2 verification against a
+        dummy hash before returning False, so a caller cannot tell a
+        missing credential apart from a wrong one by response time.
     """
     if not plain_password or not password_hash:
+        try:
+            _PWHASH_POOL.submit(
+                _PASSWORD_HASHER.verify, _DUMMY_PASSWORD_HASH, "x"
+            ).result()
+        except argon2_exceptions.VerifyMismatchError:
+            pass
         return False
 
-    password_bytes = plain_password.encode("utf-8")
-    hash_bytes = password_hash.encode("utf-8")
+    if password_hash.startswith("$2"):
+        # Legacy bcrypt hash from before the argon2 migration.
+        try:
+            result = _PWHASH_POOL.submit(
+                bcrypt.checkpw,
+                plain_password.encode("utf-8"),
+                password_hash.encode("utf-8"),
+            )
+            return result.result()
+        except ValueError:
+            # In case the stored hash is malformed
+            return False
 
     try:
-        return bcrypt.checkpw(password_bytes, hash_bytes)
-    except ValueError:
-        # In case the stored hash is malformed
+        _PWHASH_POOL.submit(
+            _PASSWORD_HASHER.verify, password_hash, plain_password
+        ).result()
+        return True
+    except (
+        argon2_exceptions.VerifyMismatchError,
+        argon2_exceptions.InvalidHashError,
+    ):
         return False
 
 
@@ -109,25 +294,40 @@ def generate_api_key() -> str:
     The whole string (including prefix) will be hashed and stored in DB.
     The plaintext value is returned ONCE to the caller.
 
+    The token body is built directly from ``secrets.token_bytes`` plus
+    one base64url encode, joined to the prefix as bytes and decoded
+    once — same output shape as ``token_urlsafe``, with fewer
+    intermediate string allocations on the signup path.
+
     Returns:
         str: The newly generated plaintext API key.
     """
-    token = secrets.token_urlsafe(32)
-    return f"{API_KEY_PREFIX}{token}"
+    raw = secrets.token_bytes(32)
+    body = base64.urlsafe_b64encode(raw).rstrip(b"=")
+    return (_API_KEY_PREFIX_BYTES + body).decode("ascii")
 
 
-def hash_api_key(api_key: str) -> str:
-    """Hash the API key using SHA-256.
+def hash_api_key(api_key: str) -> bytes:
+    """Hash the API key using keyed BLAKE2b with the deployment pepper.
 
-    This is what is stored in the database in ``clients.api_key_hash``.
+    This is what is stored in the database in ``clients.api_key_hash``
+    (a ``BYTEA`` column): a raw 32-byte digest, so the unique index
+    stays small and Postgres compares fixed-length binary. BLAKE2b is
+    faster than SHA-256 per hash, and its built-in keyed mode gives the
+    peppering a MAC construction without HMAC's double-hash overhead —
+    a leaked table alone is not brute-forceable offline.
 
     Args:
         api_key: The plaintext API key.
 
     Returns:
-        str: Hex digest of the SHA-256 hash of the API key.
+        bytes: Raw 32-byte keyed-BLAKE2b digest of the API key.
     """
-    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(
+        api_key.encode("utf-8"),
+        key=_API_KEY_PEPPER,
+        digest_size=32,
+    ).digest()
 
 
 def _row_to_client(row: dict) -> Client:
@@ -154,8 +354,8 @@ def register_client(email: str, password: str) -> tuple[Client, str]:
     Steps:
         - Normalize and validate email.
         - Check if email is already in use.
-        - Hash password with bcrypt.
-        - Generate an API key (plaintext) and hash it (SHA-256).
+        - Hash password with argon2id.
+        - Generate an API key (plaintext) and hash it (keyed BLAKE2b).
         - Persist the client via ``clients_repo.create_client(...)``.
         - Return ``(Client, api_key_plaintext)``.
 
@@ -172,7 +372,7 @@ def register_client(email: str, password: str) -> tuple[Client, str]:
         tuple[Client, str]: The created Client and the plaintext API key.
     """
     normalized_email = email.strip().lower()
-    if "@" not in normalized_email:
+    if not _EMAIL_RE.match(normalized_email):
         raise ValueError("Invalid email format.")
 
     if not password:
@@ -206,7 +406,7 @@ def resolve_client_by_api_key(api_key: str) -> Optional[Client]:
 
     Behaviour:
         - If the API key is missing or has a wrong prefix -> return ``None``.
-        - Hash the API key (SHA-256) and look it up via
+        - Hash the API key (keyed BLAKE2b) and look it up via
           ``clients_repo.get_client_by_api_key_hash()``.
         - If not found or client is inactive -> return ``None``.
         - Else return a ``Client`` instance.
@@ -223,19 +423,52 @@ def resolve_client_by_api_key(api_key: str) -> Optional[Client]:
     if not api_key:
         return None
 
-    if not api_key.startswith(API_KEY_PREFIX):
+    # Cheapest filters first, before any hashing: real keys carry the
+    # prefix plus a 43-char base64url body, so anything shorter than
+    # prefix+16 is garbage and is rejected on a single length compare.
+    # The prefix itself is checked via compare_digest: startswith()
+    # short-circuits on the first mismatching byte, which leaks match
+    # length via timing. The comparison runs on bytes because
+    # compare_digest raises on non-ASCII str input, and Werkzeug
+    # decodes headers as latin-1 — a stray high byte must mean a clean
+    # rejection, not a 500.
+    if len(api_key) < _API_KEY_PREFIX_LEN + 16 or not hmac.compare_digest(
+        api_key.encode("utf-8", "surrogateescape")[:_API_KEY_PREFIX_LEN],
+        _API_KEY_PREFIX_BYTES,
+    ):
         return None
 
     api_key_hash = hash_api_key(api_key)
-    row = clients_repo.get_client_by_api_key_hash(api_key_hash)
 
-    if row is None:
+    with _api_key_cache_lock:
+        cached = _api_key_cache.get(api_key_hash)
+    if cached is not None:
+        return cached
+
+    # Known-bad digest: reject without touching the database.
+    with _bad_key_cache_lock:
+        if api_key_hash in _bad_key_cache:
+            return None
+
+    client = clients_repo.get_client_by_api_key_hash(
+        api_key_hash, row_factory=_CLIENT_ROW_FACTORY
+    )
+
+    if client is None:
+        # Remember the miss so repeats of this key skip the DB until
+        # the TTL lapses.
+        with _bad_key_cache_lock:
+            _bad_key_cache[api_key_hash] = True
         return None
 
-    if not row.get("active", False):
+    if not client.active:
         return None
 
-    return _row_to_client(row)
+    # Only successful resolutions are cached; misses stay uncached so
+    # the cache cannot fill up with garbage keys.
+    with _api_key_cache_lock:
+        _api_key_cache[api_key_hash] = client
+    return client
 
 
 def deactivate_client(client_id: UUID) -> None:
@@ -244,7 +477,9 @@ def deactivate_client(client_id: UUID) -> None:
     Notes:
         - Current DB schema does NOT have ``deleted_at``.
         - For now, this would eventually just set ``active = false``
-            (and maybe rotate the API key).
+            (and maybe rotate the API key). When implemented, it must
+            call :func:`invalidate_api_key_cache` so the revoked key
+            stops resolving immediately.
         - To be implemented later (future sprint), likely with an
             Alembic migration if we add ``deleted_at`` or more audit fields.
 
@@ -266,9 +501,15 @@ def authenticate_client(email: str, password: str) -> Client | None:
 
     Steps:
       - Normalize the email (strip + lowercase).
-      - Lookup the client row by email.
-      - Verify the provided password against the stored hash.
-      - Map the database row to a Client dataclass.
+      - Short-circuit via the peppered login cache when these exact
+        credentials verified successfully within the last few minutes.
+      - Otherwise, look up the client row by email and verify the
+        password against the stored argon2id (or legacy bcrypt) hash.
+      - Map the database row to a Client dataclass and cache it.
+
+    Only successful verifications are cached; failures always pay the
+    full KDF cost so the cache cannot be used as a fast oracle.
+    A future password-change path must evict the affected entry.
 
     Args:
         email: The client email as provided by the user.
@@ -279,6 +520,13 @@ def authenticate_client(email: str, password: str) -> Client | None:
         credentials are valid, otherwise None.
     """
     normalized_email = email.strip().lower()
+
+    cache_key = _login_cache_key(normalized_email, password)
+    with _login_cache_lock:
+        cached = _login_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     row = clients_repo.get_client_by_email(normalized_email)
     if row is None:
         # Do not leak whether the email exists.
@@ -287,7 +535,21 @@ def authenticate_client(email: str, password: str) -> Client | None:
     if not verify_password(password, row["password_hash"]):
         return None
 
-    return _row_to_client(row)
+    if row["password_hash"].startswith("$2"):
+        # Lazy upgrade: rehash legacy bcrypt credentials with argon2id
+        # now that the plaintext is (briefly) available. Best-effort —
+        # a failed upgrade must not fail an otherwise valid login.
+        try:
+            clients_repo.update_password_hash(
+                row["id"], hash_password(password)
+            )
+        except RuntimeError:
+            pass
+
+    client = _row_to_client(row)
+    with _login_cache_lock:
+        _login_cache[cache_key] = client
+    return client
 
 
 def resolve_client_by_session_token(raw_token: str) -> Client | None:
@@ -298,9 +560,8 @@ def resolve_client_by_session_token(raw_token: str) -> Client | None:
 
     Steps:
         - Validate the raw token (non-empty, correct prefix) indirectly
-        via :func:`get_active_session_for_token`.
-        - Look up the session in the ``sessions`` table.
-        - Fetch the corresponding client row by ``client_id``.
+        via :func:`get_active_session_with_client`.
+        - Look up the session and its client row in one JOIN.
         - Return a Client dataclass if the account is active.
 
     Args:
@@ -314,17 +575,18 @@ def resolve_client_by_session_token(raw_token: str) -> Client | None:
     if not raw_token:
         return None
 
-    session = get_active_session_for_token(raw_token)
-    if session is None:
-        return None
-
-    row = clients_repo.get_client_by_id(session.client_id)
+    row = get_active_session_with_client(raw_token)
     if row is None:
-        # Session exists but client row is gone.
         return None
 
-    if not row["active"]:
+    if not row["client_active"]:
         # Do not authenticate inactive tenants.
         return None
 
-    return _row_to_client(row)
+    return Client(
+        id=row["client_id"],
+        email=row["client_email"],
+        subscription_tier=row["client_subscription_tier"],
+        active=row["client_active"],
+        created_at=row["client_created_at"],
+    )
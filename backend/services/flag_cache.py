@@ -0,0 +1,75 @@
+# NimbusFlags/backend/services/flag_cache.py
+"""Short-TTL in-memory cache for flag lookups on the hot /evaluate/ path.
+
+Flag configurations change rarely (minutes to hours) while evaluation
+traffic can run at thousands of requests per second, so a small
+time-bounded cache in front of ``postgres_flags_repo.get_flag_by_key``
+removes a database round-trip from almost every evaluation. Admin
+writes (upsert/delete) invalidate their entry immediately; other
+processes converge within the TTL.
+"""
+
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+
+try:
+    # Case 1: imported as part of the `backend` package
+    from ..repositories import postgres_flags_repo  # type: ignore[import]
+except ImportError:
+    # Case 2: modules are used as top-level packages
+    from repositories import postgres_flags_repo  # type: ignore[import]
+
+
+# Up to 10k distinct (client_id, flag_key) pairs, each kept for 30s.
+# 30s of staleness is acceptable for flag reads; admin writes through
+# this process invalidate immediately.
+_CACHE_MAXSIZE = 10_000
+_CACHE_TTL_SECONDS = 30.0
+
+_flag_cache: TTLCache = TTLCache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL_SECONDS)
+_flag_cache_lock = threading.Lock()
+
+
+def get_flag(client_id: UUID, key: str) -> Optional[dict]:
+    """Fetch a flag row, preferring the in-memory cache over Postgres.
+
+    Args:
+        client_id: UUID of the client (tenant).
+        key: The flag key (unique per client).
+
+    Returns:
+        Optional[dict]: The flag row, or ``None`` if the flag does not
+        exist. Misses (``None``) are not cached so a freshly created
+        flag becomes visible on the next evaluation.
+    """
+    cache_key = (client_id, key)
+
+    with _flag_cache_lock:
+        row = _flag_cache.get(cache_key)
+    if row is not None:
+        return row
+
+    row = postgres_flags_repo.get_flag_by_key(client_id=client_id, key=key)
+    if row is not None:
+        with _flag_cache_lock:
+            _flag_cache[cache_key] = row
+    return row
+
+
+def invalidate_flag(client_id: UUID, key: str) -> None:
+    """Drop the cached entry for a flag after an admin write.
+
+    Idempotent: invalidating a key that is not cached is a no-op.
+
+    Args:
+        client_id: UUID of the client (tenant).
+        key: The flag key that was upserted or deleted.
+    """
+    with _flag_cache_lock:
+        _flag_cache.pop((client_id, key), None)
@@ -8,7 +8,96 @@ for a given user context.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Tuple
+
+# One shared immutable empty mapping for every negative evaluation,
+# instead of allocating a fresh {} per call.
+_EMPTY_PARAMS: MappingProxyType = MappingProxyType({})
+
+# Sentinel distinguishing "attribute absent" from any real user value,
+# so a single dict.get doubles as the missing-attribute check.
+_MISSING = object()
+
+# Predicates receive the user's bound ``dict.get`` method rather than
+# the dict itself: the evaluator looks the method up once per request,
+# saving one attribute lookup per condition per evaluation.
+_Predicate = Callable[[Callable[[Any, Any], Any]], bool]
+
+
+def _make_in_predicate(attr: Any, ref: Any) -> _Predicate:
+    """Build the predicate for an ``in`` condition.
+
+    The reference list is converted to a ``frozenset`` once here, so
+    membership is an O(1) hash probe per evaluation instead of an O(n)
+    list scan — with large allowlists (countries, user ids) that scan
+    dominates evaluation cost. Falls back to the list when elements are
+    unhashable, and fails closed on a missing/empty/non-list value,
+    mirroring the interpretive rules.
+
+    Args:
+        attr: The user attribute the condition reads.
+        ref: The condition's reference value (expected non-empty list).
+
+    Returns:
+        _Predicate: Specialized membership check.
+    """
+    if not isinstance(ref, list) or not ref:
+        return lambda user_get: False
+
+    try:
+        ref_set = frozenset(ref)
+    except TypeError:
+        return lambda user_get, a=attr, r=ref: user_get(a, _MISSING) in r
+
+    def _pred(
+        user_get: Callable[[Any, Any], Any], a: Any = attr,
+        s: frozenset = ref_set, r: list = ref,
+    ) -> bool:
+        val = user_get(a, _MISSING)
+        try:
+            return val in s
+        except TypeError:
+            # Unhashable user value (e.g. a list): scan the original.
+            return val in r
+
+    return _pred
+
+
+def _compile_conditions(conditions: list) -> Tuple[_Predicate, ...]:
+    """Compile a flag's conditions into specialized predicates.
+
+    Each condition's attribute/operator/value dict lookups and operator
+    string dispatch happen once here rather than on every evaluation;
+    the returned closures only do a ``dict.get`` plus one comparison.
+    Unknown operators compile to a constant-False predicate (fail
+    closed), preserving the interpretive semantics exactly.
+
+    Args:
+        conditions: The flag's raw conditions list.
+
+    Returns:
+        Tuple[_Predicate, ...]: One predicate per condition.
+    """
+    predicates = []
+    for cond in conditions:
+        attr = cond.get("attribute")
+        operator = cond.get("operator")
+        ref = cond.get("value")
+
+        if operator == "equals":
+            # _MISSING never equals a JSON-derived value, so the absent-
+            # attribute case fails without a separate membership check.
+            predicates.append(
+                lambda user_get, a=attr, v=ref: user_get(a, _MISSING) == v
+            )
+        elif operator == "in":
+            predicates.append(_make_in_predicate(attr, ref))
+        else:
+            # Unknown operator -> fail closed
+            predicates.append(lambda user_get: False)
+
+    return tuple(predicates)
 
 
 def evaluate_flag(
@@ -48,46 +137,41 @@ def evaluate_flag(
         return {
             "flag_key": flag_key,
             "enabled": False,
-            "parameters": {},
+            "parameters": _EMPTY_PARAMS,
         }
 
-    conditions = flag.get("conditions") or []
-
-    def _matches_condition(cond: Dict[str, Any]) -> bool:
-        attr = cond.get("attribute")
-        operator = cond.get("operator")
-        ref = cond.get("value")
-
-        # Missing attribute in user -> fail
-        if attr not in user_attributes:
-            return False
-
-        val = user_attributes[attr]
-
-        if operator == "equals":
-            return val == ref
-
-        if operator == "in":
-            # value is expected to be a non-empty list
-            if not isinstance(ref, list) or not ref:
-                return False
-            return val in ref
-
-        # Unknown operator -> fail closed
-        return False
-
-    # All conditions must pass
-    for cond in conditions:
-        if not _matches_condition(cond):
+    # Conditions are compiled to specialized predicates once per flag
+    # object and memoized on it; cached rows (services.flag_cache) are
+    # reused across requests, so recompilation happens at most once per
+    # cache fill instead of per evaluation.
+    predicates = flag.get("_compiled")
+    if predicates is None:
+        predicates = _compile_conditions(flag.get("conditions") or [])
+        flag["_compiled"] = predicates
+
+    # All conditions must pass. The bound ``dict.get`` is looked up once
+    # here and handed to every predicate, instead of each condition
+    # re-resolving the attribute on the user dict.
+    user_get = user_attributes.get
+    for predicate in predicates:
+        if not predicate(user_get):
             return {
                 "flag_key": flag_key,
                 "enabled": False,
-                "parameters": {},
+                "parameters": _EMPTY_PARAMS,
             }
 
-    # All conditions passed
+    # All conditions passed. The parameters dict is frozen into a
+    # MappingProxyType once per flag object (memoized like _compiled):
+    # every positive evaluation shares one immutable view instead of
+    # re-running `.get(...) or {}` and handing callers a mutable dict.
+    params_view = flag.get("_parameters_view")
+    if params_view is None:
+        params_view = MappingProxyType(flag.get("parameters") or {})
+        flag["_parameters_view"] = params_view
+
     return {
         "flag_key": flag_key,
         "enabled": True,
-        "parameters": flag.get("parameters") or {},
+        "parameters": params_view,
     }
@@ -9,6 +9,7 @@ sessions stored in the PostgreSQL ``sessions`` table.
 from __future__ import annotations
 
 import hashlib
+import hmac
 import secrets
 import uuid
 from dataclasses import dataclass
@@ -25,9 +26,31 @@ except ImportError:
 
 
 SESSION_TOKEN_PREFIX = "nsess_"
+_SESSION_TOKEN_PREFIX_LEN = len(SESSION_TOKEN_PREFIX)
+_SESSION_TOKEN_PREFIX_BYTES = SESSION_TOKEN_PREFIX.encode("ascii")
 # Short TTL for now; you can increase to 7 days or more if needed.
 SESSION_TTL_DAYS = 1
 
+# Session-token auth needs both the session row and its client row.
+# Fetching them in one JOIN halves the round trips on every dashboard
+# request; client columns are aliased so dict_row keys stay unambiguous.
+_GET_ACTIVE_SESSION_WITH_CLIENT_SQL = """
+    SELECT s.id,
+           s.client_id,
+           s.created_at,
+           s.expires_at,
+           s.revoked_at,
+           c.email AS client_email,
+           c.subscription_tier AS client_subscription_tier,
+           c.active AS client_active,
+           c.created_at AS client_created_at
+    FROM sessions s
+    JOIN clients c ON c.id = s.client_id
+    WHERE s.token_hash = %s
+      AND s.revoked_at IS NULL
+      AND s.expires_at > %s;
+"""
+
 
 @dataclass(frozen=True)
 class Session:
@@ -70,20 +93,45 @@ def _generate_raw_token() -> str:
     return SESSION_TOKEN_PREFIX + secrets.token_urlsafe(32)
 
 
-def _hash_token(raw_token: str) -> str:
+def _has_session_prefix(raw_token: str) -> bool:
+    """Check the session-token prefix in constant time.
+
+    ``startswith`` short-circuits at the first mismatching byte, which
+    leaks how much of the prefix matched via timing; ``compare_digest``
+    compares the full slice regardless. The comparison runs on bytes
+    because ``compare_digest`` raises on non-ASCII str input, and
+    Werkzeug decodes headers as latin-1 — a stray high byte must mean
+    a clean rejection, not an exception.
+
+    Args:
+        raw_token: The raw session token string to check.
+
+    Returns:
+        True if the token carries the ``nsess_`` prefix.
+    """
+    return len(raw_token) >= _SESSION_TOKEN_PREFIX_LEN and hmac.compare_digest(
+        raw_token.encode("utf-8", "surrogateescape")[
+            :_SESSION_TOKEN_PREFIX_LEN
+        ],
+        _SESSION_TOKEN_PREFIX_BYTES,
+    )
+
+
+def _hash_token(raw_token: str) -> bytes:
     """Compute the SHA-256 hash of a raw session token.
 
-    The raw token is never stored in the database; only its hash is kept.
-    This function centralizes the hashing strategy.
+    The raw token is never stored in the database; only its hash is kept
+    in ``sessions.token_hash`` (a ``BYTEA`` column), as the raw 32-byte
+    digest. This function centralizes the hashing strategy.
 
     Args:
         raw_token: The raw session token string as received from the
             client or generated by the backend.
 
     Returns:
-        A hexadecimal SHA-256 digest of the token.
+        The raw SHA-256 digest of the token.
     """
-    return hashlib.sha256(raw_token.encode("utf-8")).hexdigest()
+    return hashlib.sha256(raw_token.encode("utf-8")).digest()
 
 
 def create_session_for_client(client_id: uuid.UUID) -> tuple[Session, str]:
@@ -155,7 +203,7 @@ def delete_session_for_token(raw_token: str) -> None:
     if not raw_token:
         return
 
-    if not raw_token.startswith(SESSION_TOKEN_PREFIX):
+    if not _has_session_prefix(raw_token):
         # Do not even hash obviously invalid tokens.
         return
 
@@ -209,7 +257,7 @@ def get_active_session_for_token(raw_token: str) -> Optional[Session]:
     if not raw_token:
         return None
 
-    if not raw_token.startswith(SESSION_TOKEN_PREFIX):
+    if not _has_session_prefix(raw_token):
         # Reject obviously invalid tokens early.
         return None
 
@@ -240,6 +288,69 @@ def get_active_session_for_token(raw_token: str) -> Optional[Session]:
     return _row_to_session(row)
 
 
+def get_active_session_with_client(raw_token: str) -> Optional[dict]:
+    """Resolve an active session together with its client row in one query.
+
+    Used by session-token authentication, which needs both the session
+    (validity) and the client (identity). Doing it as a single JOIN
+    costs one round trip instead of two sequential lookups.
+
+    Args:
+        raw_token:
+            The raw session token string provided by the client.
+
+    Returns:
+        The joined row as a dict (session columns plus ``client_*``
+        aliased client columns) if a matching active session is found;
+        otherwise ``None``.
+    """
+    if not raw_token:
+        return None
+
+    if not _has_session_prefix(raw_token):
+        # Reject obviously invalid tokens early.
+        return None
+
+    token_hash = _hash_token(raw_token)
+    now = datetime.now(timezone.utc)
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                _GET_ACTIVE_SESSION_WITH_CLIENT_SQL,
+                (token_hash, now),
+                prepare=True,
+            )
+            return cur.fetchone()
+
+
+def purge_expired_sessions(older_than_days: int = 7) -> int:
+    """Delete sessions whose expiry is comfortably in the past.
+
+    Keeps the ``sessions`` table (and its indexes) from growing without
+    bound as short-lived dashboard sessions accumulate. Intended to be
+    called from a scheduled job (cron / one-off management command);
+    nothing in the request path depends on it.
+
+    Args:
+        older_than_days:
+            Grace period after expiry before a session row is removed.
+            Defaults to 7 days so recent history stays inspectable.
+
+    Returns:
+        The number of session rows deleted.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "DELETE FROM sessions WHERE expires_at < %s",
+                (cutoff,),
+            )
+            return cur.rowcount
+
+
 def get_session_for_token(raw_token: str) -> Optional[Session]:
     """
     Backward-compatibile wrapper for legacy imports.
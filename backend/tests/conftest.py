@@ -0,0 +1,54 @@
+# backend/tests/conftest.py
+"""Shared pytest fixtures for the backend test suite."""
+
+
+import pathlib
+import sys
+
+import pytest
+from argon2 import PasswordHasher
+
+# Ensure backend/ is on sys.path so both import spellings below resolve.
+BACKEND_DIR = pathlib.Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from backend.services import clients_service as _clients_service_pkg
+from services import clients_service as _clients_service_flat
+
+# The unit tests import `backend.services.clients_service` while the
+# Flask app under integration test imports `services.clients_service`;
+# Python treats those as two distinct module instances, so the cheap
+# hasher has to be installed in both.
+_CLIENTS_SERVICE_MODULES = (_clients_service_pkg, _clients_service_flat)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hasher():
+    """Swap in a cheap argon2id hasher for the whole test run.
+
+    Production parameters (64 MiB, multi-lane) exist to slow attackers
+    down, which also slows every hashing test down. The reduced-cost
+    hasher keeps the same algorithm and PHC hash format, so prefix and
+    verification assertions are unaffected while the suite stops paying
+    the full KDF cost per test. The dummy hash burned on empty
+    credentials is recomputed to match, so that path is cheap too.
+    """
+    cheap = PasswordHasher(
+        time_cost=1,
+        memory_cost=8,  # KiB — argon2's minimum, test-only
+        parallelism=1,
+    )
+    cheap_dummy = cheap.hash("nimbusflags-dummy")
+
+    originals = [
+        (mod, mod._PASSWORD_HASHER, mod._DUMMY_PASSWORD_HASH)
+        for mod in _CLIENTS_SERVICE_MODULES
+    ]
+    for mod in _CLIENTS_SERVICE_MODULES:
+        mod._PASSWORD_HASHER = cheap
+        mod._DUMMY_PASSWORD_HASH = cheap_dummy
+    yield
+    for mod, hasher, dummy in originals:
+        mod._PASSWORD_HASHER = hasher
+        mod._DUMMY_PASSWORD_HASH = dummy
@@ -30,13 +30,17 @@ except ImportError:
     flask_app = _create_app()
 
 
-@pytest.fixture(scope="module")
+# Session-scoped: the Flask app (and its blueprints, pools and caches)
+# boots once for the whole run instead of once per module. Tests stay
+# independent by generating unique emails/flags rather than by tearing
+# the app down.
+@pytest.fixture(scope="session")
 def client():
     with flask_app.test_client() as c:
         yield c
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def api_key(client):
     """Create a test client (tenant) and return its API key.
 
@@ -36,13 +36,26 @@ def test_hash_and_verify_password_success():
 
     assert isinstance(password_hash, str)
     assert password_hash != plain
-    # bcrypt hashes usually start with "$2b$" or "$2a$"
-    assert password_hash.startswith("$2")
+    # New hashes use argon2id (PHC string format)
+    assert password_hash.startswith("$argon2id$")
 
     assert verify_password(plain, password_hash) is True
     assert verify_password("wrong_password", password_hash) is False
 
 
+def test_verify_password_accepts_legacy_bcrypt_hash():
+    import bcrypt
+
+    plain = "legacy_password"
+    # Low cost keeps the test fast; production legacy hashes are cost 12.
+    legacy_hash = bcrypt.hashpw(
+        plain.encode("utf-8"), bcrypt.gensalt(rounds=4)
+    ).decode("utf-8")
+
+    assert verify_password(plain, legacy_hash) is True
+    assert verify_password("wrong_password", legacy_hash) is False
+
+
 def test_hash_password_empty_raises_value_error():
     with pytest.raises(ValueError):
         hash_password("")
@@ -70,7 +83,7 @@ def test_hash_api_key_is_deterministic():
     h1 = hash_api_key(key)
     h2 = hash_api_key(key)
     assert h1 == h2
-    assert len(h1) == 64  # sha256 hex digest
+    assert len(h1) == 32  # raw sha256 digest (stored as BYTEA)
 
 
 # ---------- register_client ----------
@@ -138,7 +151,7 @@ def test_register_client_creates_client_and_returns_api_key(monkeypatch):
 
     # Password is hashed
     assert created_clients["password_hash"] != "my_password"
-    assert created_clients["password_hash"].startswith("$2")
+    assert created_clients["password_hash"].startswith("$argon2id$")
 
     # The stored api_key_hash matches the plaintext api key returned
     expected_hash = hash_api_key(api_key_plain)
@@ -190,21 +203,18 @@ def test_resolve_client_by_api_key_returns_client_when_active(monkeypatch):
     api_key = generate_api_key()
     api_key_hash = hash_api_key(api_key)
 
-    def fake_get_client_by_api_key_hash(received_hash: str):
+    def fake_get_client_by_api_key_hash(received_hash, row_factory=None):
         # Ensure the service hashed the key correctly
         assert received_hash == api_key_hash
 
-        client_id = uuid4()
-        now = datetime.now(timezone.utc)
-        return {
-            "id": client_id,
-            "email": "user@example.com",
-            "password_hash": "ignored",
-            "api_key_hash": api_key_hash,
-            "subscription_tier": "free",
-            "active": True,
-            "created_at": now,
-        }
+        # The real repo builds the Client via class_row; mirror that.
+        return Client(
+            id=uuid4(),
+            email="user@example.com",
+            subscription_tier="free",
+            active=True,
+            created_at=datetime.now(timezone.utc),
+        )
 
     monkeypatch.setattr(
             "backend.services.clients_service.clients_repo"
@@ -225,8 +235,15 @@ def test_resolve_client_by_api_key_returns_none_for_missing_or_wrong_prefix():
     assert resolve_client_by_api_key("random_string_without_prefix") is None
 
 
+def test_resolve_client_by_api_key_rejects_non_ascii_key():
+    # Werkzeug decodes headers as latin-1, so a high byte can reach the
+    # service; it must be rejected like any wrong prefix, not raise.
+    assert resolve_client_by_api_key("\xe9f_live_" + "a" * 43) is None
+    assert resolve_client_by_api_key("nf_liv\xe9_" + "a" * 43) is None
+
+
 def test_resolve_client_by_api_key_returns_none_when_not_found(monkeypatch):
-    def fake_get_client_by_api_key_hash(api_key_hash: str):
+    def fake_get_client_by_api_key_hash(api_key_hash, row_factory=None):
         return None
 
     monkeypatch.setattr(
@@ -244,19 +261,15 @@ def test_resolve_client_by_api_key_returns_none_when_inactive(monkeypatch):
     api_key = generate_api_key()
     api_key_hash = hash_api_key(api_key)
 
-    def fake_get_client_by_api_key_hash(received_hash: str):
+    def fake_get_client_by_api_key_hash(received_hash, row_factory=None):
         assert received_hash == api_key_hash
-        client_id = uuid4()
-        now = datetime.now(timezone.utc)
-        return {
-            "id": client_id,
-            "email": "user@example.com",
-            "password_hash": "ignored",
-            "api_key_hash": api_key_hash,
-            "subscription_tier": "free",
-            "active": False,  # inactive
-            "created_at": now,
-        }
+        return Client(
+            id=uuid4(),
+            email="user@example.com",
+            subscription_tier="free",
+            active=False,  # inactive
+            created_at=datetime.now(timezone.utc),
+        )
 
     monkeypatch.setattr(
             "backend.services.clients_service.clients_repo"
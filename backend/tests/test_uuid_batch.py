@@ -0,0 +1,18 @@
+# NimbusFlags/backend/tests/test_uuid_batch.py
+"""Unit tests for the batch-amortized UUID generator."""
+
+from backend.repositories._uuid_batch import fast_uuid4
+
+
+def test_fast_uuid4_is_valid_version_4():
+    u = fast_uuid4()
+    assert u.version == 4
+    # RFC 4122 variant (10xx in the high bits of clock_seq_hi).
+    assert u.variant == "specified in RFC 4122"
+
+
+def test_fast_uuid4_is_unique_across_refills():
+    # More than one buffer's worth would be slow in CI; a few thousand
+    # is enough to catch cursor/slicing bugs within a batch.
+    seen = {fast_uuid4() for _ in range(5000)}
+    assert len(seen) == 5000
@@ -0,0 +1,39 @@
+# NimbusFlags/backend/validators/_schema_freeze.py
+"""Recursive freezing helper for the exported JSON Schema constants.
+
+Shared by the validator modules so each can publish its parsed schema
+as a deeply immutable structure: dicts become ``MappingProxyType``
+views, lists become tuples, and string keys/values are interned so
+repeated lookups compare by pointer. Frozen module state also stays
+copy-on-write-shared across pre-fork gunicorn workers.
+"""
+
+
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze_schema(obj: Any) -> Any:
+    """Recursively convert a parsed JSON document into a frozen form.
+
+    Args:
+        obj: Any value produced by a JSON parser (dict, list, str,
+            number, bool or None).
+
+    Returns:
+        The same structure with every dict wrapped in
+        ``MappingProxyType``, every list converted to a tuple, and
+        every string interned. Scalars pass through unchanged.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return MappingProxyType(
+            {sys.intern(k): freeze_schema(v) for k, v in obj.items()}
+        )
+    if isinstance(obj, list):
+        return tuple(freeze_schema(v) for v in obj)
+    return obj
@@ -2,25 +2,37 @@
 """
 Validator for /evaluate/ requests using JSON Schema.
 
-This module loads the EvaluateRequest JSON Schema once at import time and
-exposes a helper to validate incoming payloads, raising BadRequest on error.
+This module loads the EvaluateRequest JSON Schema and compiles it to a
+specialized validation function once at import time, then exposes a
+helper to validate incoming payloads, raising BadRequest on error.
 """
 
 
 from pathlib import Path
-import json
-from jsonschema import validate as js_validate, ValidationError
+
+import fastjsonschema
+import orjson
+
 from errors.handlers import BadRequest
 
+from ._schema_freeze import freeze_schema
+
 
 # Resovle schema path
 SCHEMA_PATH = (
     Path(__file__).parent.parent / "schemas" / "EvaluateRequest.schema.json"
 )
 
-# Load schema
-with SCHEMA_PATH.open("r", encoding="utf-8") as f:
-    EVALUATE_REQUEST_SCHEMA = json.load(f)
+# Load schema. The exported constant is deeply frozen: nothing may
+# mutate the schema after the validator below is compiled from it, and
+# frozen module state stays shared across pre-fork gunicorn workers.
+_SCHEMA = orjson.loads(SCHEMA_PATH.read_bytes())
+EVALUATE_REQUEST_SCHEMA = freeze_schema(_SCHEMA)
+
+# fastjsonschema generates a specialized validation function for this
+# exact schema at import time, so per-request validation runs straight
+# type/key checks instead of jsonschema's reflective schema-tree walk.
+_VALIDATE_EVAL = fastjsonschema.compile(_SCHEMA)
 
 
 def validate_eval_payload(payload: dict) -> None:
@@ -37,7 +49,7 @@ def validate_eval_payload(payload: dict) -> None:
         raise BadRequest("Payload must be a JSON object.")
 
     try:
-        js_validate(instance=payload, schema=EVALUATE_REQUEST_SCHEMA)
-    except ValidationError as e:
+        _VALIDATE_EVAL(payload)
+    except fastjsonschema.JsonSchemaException as e:
         msg = getattr(e, "message", None) or str(e)
         raise BadRequest(f"Invalid EvaluateRequest: {msg}")
@@ -2,16 +2,21 @@
 """
 Validator for admin FlagConfig payloads using JSON Schema.
 
-This module loads the FlagConfig JSON Schema once at import time and exposes
-a helper to validate incoming admin flag configuration payloads.
+This module loads the FlagConfig JSON Schema and compiles it to a
+specialized validation function once at import time, then exposes a
+helper to validate incoming admin flag configuration payloads.
 """
 
 
 from pathlib import Path
-import json
-from jsonschema import validate as js_validate, ValidationError
+
+import fastjsonschema
+import orjson
+
 from errors.handlers import BadRequest
 
+from ._schema_freeze import freeze_schema
+
 # Resolve schema path
 SCHEMA_PATH = (
     Path(__file__).resolve().parent.parent
@@ -19,9 +24,16 @@ SCHEMA_PATH = (
     / "flag_config.schema.json"
 )
 
-# Load schema
-with SCHEMA_PATH.open("r", encoding="utf-8") as f:
-    FLAG_CONFIG_SCHEMA = json.load(f)
+# Load schema. The exported constant is deeply frozen: nothing may
+# mutate the schema after the validator below is compiled from it, and
+# frozen module state stays shared across pre-fork gunicorn workers.
+_SCHEMA = orjson.loads(SCHEMA_PATH.read_bytes())
+FLAG_CONFIG_SCHEMA = freeze_schema(_SCHEMA)
+
+# fastjsonschema generates a specialized validation function for this
+# exact schema at import time, so per-request validation runs straight
+# type/key checks instead of jsonschema's reflective schema-tree walk.
+_VALIDATE_FLAG = fastjsonschema.compile(_SCHEMA)
 
 
 def validate_flag_config(payload: dict) -> None:
@@ -38,7 +50,7 @@ def validate_flag_config(payload: dict) -> None:
         raise BadRequest("Body must be a JSON object.")
 
     try:
-        js_validate(instance=payload, schema=FLAG_CONFIG_SCHEMA)
-    except ValidationError as e:
+        _VALIDATE_FLAG(payload)
+    except fastjsonschema.JsonSchemaException as e:
         msg = getattr(e, "message", None) or str(e)
         raise BadRequest(f"Invalid FlagConfig: {msg}")
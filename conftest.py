@@ -0,0 +1,15 @@
+# NimbusFlags/conftest.py
+"""Pytest bootstrap for the NimbusFlags repository.
+
+Ensures ``backend/`` is importable as top-level packages (``services``,
+``repositories``, ...) so application modules can use a single canonical
+import path instead of per-module try/except ImportError fallbacks.
+"""
+
+
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent / "backend"
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))